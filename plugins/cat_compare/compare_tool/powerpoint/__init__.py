@@ -1,13 +1,21 @@
 # compare_tool/powerpoint/__init__.py
 
+import functools
+import heapq
+import io
 import logging
 import os
-from typing import Any, Dict, Optional, List
+from typing import Any, Callable, Dict, Optional, List, Tuple
 
+import numpy as np
 import pandas as pd
 from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.util import Inches, Pt
 
+from .base import EXCEL_ENGINE, count_nonempty
+
 log = logging.getLogger(__name__)
 
 # NEW: import the specialised generators
@@ -28,31 +36,170 @@ except ImportError:
     generate_powerpoint_from_apm = None  # type: ignore
 
 
+# ---------------------------------------------------------------------------
+# Helper: cached sheet reads
+# ---------------------------------------------------------------------------
+def _read_sheet_openpyxl_ro(
+    path: str, sheet_name: str, usecols: Optional[Callable[[Any], bool]] = None
+) -> pd.DataFrame:
+    """
+    openpyxl fallback for pd.read_excel: stream plain cell values from a
+    read-only workbook (no Cell object per cell) and hand them to pandas'
+    own TextParser, cleaned the way pandas' openpyxl reader does, so the
+    resulting frame is the same.
+    """
+    from openpyxl import load_workbook
+    from openpyxl.cell.cell import ERROR_CODES
+    from pandas.errors import EmptyDataError
+    from pandas.io.parsers import TextParser
+
+    errors = frozenset(ERROR_CODES)
+    wb = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        ws = wb[sheet_name]
+        ws.reset_dimensions()
+        data: List[list] = []
+        last_row_with_data = -1
+        for row_number, values in enumerate(ws.values):
+            row = [
+                ""
+                if v is None
+                else int(v)
+                if v.__class__ is float and v.is_integer()
+                else np.nan
+                if v.__class__ is str and v in errors
+                else v
+                for v in values
+            ]
+            while row and row[-1] == "":
+                row.pop()
+            if row:
+                last_row_with_data = row_number
+            data.append(row)
+    finally:
+        wb.close()
+
+    data = data[: last_row_with_data + 1]
+    if data:
+        width = max(len(row) for row in data)
+        data = [row + [""] * (width - len(row)) for row in data]
+
+    try:
+        return TextParser(
+            data, header=0, usecols=usecols, skip_blank_lines=False
+        ).read()
+    except EmptyDataError:
+        return pd.DataFrame()
+
+
+@functools.lru_cache(maxsize=32)
+def _read_sheet_cached(
+    path: str,
+    mtime: float,
+    sheet_name: str,
+    usecols: Optional[Tuple[str, ...]] = None,
+) -> pd.DataFrame:
+    """
+    Read one sheet of a workbook, optionally only the named columns (missing
+    ones are ignored). Cached per (path, mtime, sheet_name, usecols), so a
+    rewritten workbook is read again; callers must not mutate the result.
+    """
+    wanted = (lambda col: col in usecols) if usecols else None
+    if EXCEL_ENGINE == "openpyxl":
+        return _read_sheet_openpyxl_ro(path, sheet_name, usecols=wanted)
+    return pd.read_excel(
+        path, sheet_name=sheet_name, engine=EXCEL_ENGINE, usecols=wanted
+    )
+
+
+def _read_sheet(
+    path: str, sheet_name: str, usecols: Optional[Tuple[str, ...]] = None
+) -> pd.DataFrame:
+    """
+    Return a private copy of a sheet, going through _read_sheet_cached.
+    """
+    path = os.path.abspath(path)
+    return _read_sheet_cached(
+        path, os.path.getmtime(path), sheet_name, usecols
+    ).copy()
+
+
+def _clear_sheet_cache() -> None:
+    """
+    Drop every cached sheet (mainly for tests).
+    """
+    _read_sheet_cached.cache_clear()
+
 
 # ---------------------------------------------------------------------------
 # Helper: load the Analysis sheet
 # ---------------------------------------------------------------------------
-def _load_analysis(comparison_result_path: str) -> pd.DataFrame:
+# Possible application-name columns, in order of preference
+_NAME_COLUMNS = ("name", "Name", "application", "Application", "ApplicationName")
+
+# The generic deck only ever looks at these Analysis columns
+_ANALYSIS_COLUMNS = _NAME_COLUMNS + ("OverallAssessment",)
+
+
+def _load_analysis(
+    comparison_result_path: str,
+    usecols: Optional[Tuple[str, ...]] = _ANALYSIS_COLUMNS,
+) -> pd.DataFrame:
     """
-    Load the 'Analysis' sheet from the comparison_result workbook.
+    Load the 'Analysis' sheet from the comparison_result workbook, limited to
+    `usecols` (names absent from the sheet are skipped; None = every column).
     """
     log.info("Loading Analysis sheet from %s", comparison_result_path)
-    return pd.read_excel(comparison_result_path, sheet_name="Analysis")
+    df = _read_sheet(comparison_result_path, "Analysis", usecols=usecols)
+    if usecols and df.columns.empty:
+        # None of the expected columns – keep the whole sheet so that the row
+        # count (and the index-based detail fallback) still work.
+        df = _read_sheet(comparison_result_path, "Analysis")
+    return df
 
 
 # ---------------------------------------------------------------------------
-# Helper: overall upgrade/downgrade counts from OverallAssessment
+# Helper: classify OverallAssessment rows as upgraded / downgraded
 # ---------------------------------------------------------------------------
-def _count_overall(df: pd.DataFrame) -> Dict[str, Any]:
+def _classify(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Single pass over an object array: (mentions 'upgraded', mentions
+    'downgraded'), case-insensitive. Non-string cells count as neither.
+    """
+    improved = np.zeros(len(values), dtype=bool)
+    degraded = np.zeros(len(values), dtype=bool)
+    for i, v in enumerate(values):
+        if isinstance(v, str):
+            s = v.lower()
+            improved[i] = "upgraded" in s
+            degraded[i] = "downgraded" in s
+    return improved, degraded
+
+
+def _change_masks(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Compute how many rows are Upgraded / Downgraded based on OverallAssessment.
+    Return (improved, degraded) boolean arrays: whether each row's
+    OverallAssessment mentions 'Upgraded' / 'Downgraded' (case-insensitive).
+
+    A missing column yields all-False masks.
     """
     if "OverallAssessment" not in df.columns:
-        return {"improved": 0, "degraded": 0, "result": "Even", "percentage": 0}
+        unchanged = np.zeros(len(df), dtype=bool)
+        return unchanged, unchanged.copy()
+
+    return _classify(df["OverallAssessment"].to_numpy(dtype=object))
 
-    s = df["OverallAssessment"].astype(str)
-    improved = int(s.str.contains("Upgraded", case=False, na=False).sum())
-    degraded = int(s.str.contains("Downgraded", case=False, na=False).sum())
+
+# ---------------------------------------------------------------------------
+# Helper: overall upgrade/downgrade counts from OverallAssessment
+# ---------------------------------------------------------------------------
+def _count_overall(improved_mask: np.ndarray, degraded_mask: np.ndarray) -> Dict[str, Any]:
+    """
+    Compute how many rows are Upgraded / Downgraded from the _change_masks()
+    of the Analysis sheet.
+    """
+    improved = int(np.count_nonzero(improved_mask))
+    degraded = int(np.count_nonzero(degraded_mask))
 
     if improved > degraded:
         result = "Increase"
@@ -76,6 +223,26 @@ def _count_overall(df: pd.DataFrame) -> Dict[str, Any]:
 # ---------------------------------------------------------------------------
 # Helper: pick template path based on config + domain
 # ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=8)
+def _list_template_dir_cached(folder: str, mtime: float) -> frozenset:
+    """
+    Names of the regular files in a template folder. Cached per (folder,
+    mtime): adding or removing a template changes the folder's mtime.
+    """
+    with os.scandir(folder) as entries:
+        return frozenset(e.name for e in entries if e.is_file())
+
+
+def _list_template_dir(folder: str) -> frozenset:
+    """
+    Like _list_template_dir_cached, but an unreadable/missing folder is empty.
+    """
+    try:
+        return _list_template_dir_cached(folder, os.stat(folder).st_mtime)
+    except OSError:
+        return frozenset()
+
+
 def _pick_template_path(config: Optional[Dict[str, Any]], domain: str) -> Optional[str]:
     """
     Very simple template resolution:
@@ -98,6 +265,7 @@ def _pick_template_path(config: Optional[Dict[str, Any]], domain: str) -> Option
             return path
 
     template_folder = cfg.get("TEMPLATE_FOLDER", "templates")
+    available = _list_template_dir(template_folder)
 
     domain_name = {
         "APM": "template.pptx",          # legacy APM template name
@@ -105,12 +273,34 @@ def _pick_template_path(config: Optional[Dict[str, Any]], domain: str) -> Option
         "MRUM": "template_mrum.pptx",
     }.get(domain, "template.pptx")
 
-    candidate = os.path.join(template_folder, domain_name)
-    if os.path.exists(candidate):
-        return candidate
+    if domain_name in available:
+        return os.path.join(template_folder, domain_name)
 
-    generic = os.path.join(template_folder, "template.pptx")
-    return generic if os.path.exists(generic) else None
+    if "template.pptx" in available:
+        return os.path.join(template_folder, "template.pptx")
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Helper: cached template bytes
+# ---------------------------------------------------------------------------
+@functools.lru_cache(maxsize=8)
+def _load_template_bytes(path: str, mtime: float) -> bytes:
+    """
+    Read a .pptx template into memory. Cached per (path, mtime); each caller
+    builds its own Presentation from the bytes, since decks are mutated.
+    """
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+def _open_template(path: str) -> Presentation:
+    """
+    Open a fresh Presentation from the (cached) template bytes.
+    """
+    path = os.path.abspath(path)
+    data = _load_template_bytes(path, os.path.getmtime(path))
+    return Presentation(io.BytesIO(data))
 
 
 # ---------------------------------------------------------------------------
@@ -121,8 +311,7 @@ def _find_name_column(df: pd.DataFrame) -> Optional[str]:
     Try to detect which column holds the application name.
     Works with 'name', 'Name', 'application', 'Application', etc.
     """
-    candidates = ["name", "Name", "application", "Application", "ApplicationName"]
-    for col in candidates:
+    for col in _NAME_COLUMNS:
         if col in df.columns:
             return col
     return None
@@ -131,10 +320,28 @@ def _find_name_column(df: pd.DataFrame) -> Optional[str]:
 # ---------------------------------------------------------------------------
 # Helper: build rows for the detail slide
 # ---------------------------------------------------------------------------
-def _build_detail_rows(df: pd.DataFrame) -> List[str]:
+_DETAIL_ROW_LIMIT = 40
+
+
+def _first_by_name(df: pd.DataFrame, k: int) -> pd.DataFrame:
+    """
+    Return the k rows of df with the smallest "name", in (stable) name order,
+    using a heap rather than a full sort.
+    """
+    names = df["name"].tolist()
+    order = heapq.nsmallest(k, range(len(names)), key=names.__getitem__)
+    return df.iloc[order]
+
+
+def _build_detail_rows(
+    df: pd.DataFrame, changed_mask: Optional[np.ndarray] = None
+) -> List[str]:
     """
     Build human-readable lines for each application for the detail slide.
     The idea is to make BRUM/MRUM obviously show real data.
+
+    changed_mask: optional precomputed "row is Upgraded or Downgraded" flags
+    (see _change_masks); computed here when not given.
     """
     if df.empty:
         return []
@@ -153,9 +360,10 @@ def _build_detail_rows(df: pd.DataFrame) -> List[str]:
     )
 
     # Mark which rows have any "change"
-    has_change = overall_series.str.contains(
-        "Upgraded|Downgraded", case=False, na=False
-    )
+    if changed_mask is None:
+        improved, degraded = _change_masks(df)
+        changed_mask = improved | degraded
+    has_change = changed_mask
 
     # We want changed apps first, then the rest
     df_detail = pd.DataFrame(
@@ -166,25 +374,22 @@ def _build_detail_rows(df: pd.DataFrame) -> List[str]:
         }
     )
 
-    # Sort: changed first, then alphabetical by name
-    df_detail = df_detail.sort_values(
-        by=["changed", "name"], ascending=[False, True]
-    )
-
-    lines: List[str] = []
-    for _, row in df_detail.iterrows():
-        name = row["name"].strip() or "(Unnamed App)"
-        overall = row["overall"].strip()
-
-        if overall:
-            line = f"{name} – {overall}"
-        else:
-            line = name
-
-        lines.append(line)
+    # Changed first, then alphabetical by name – but don't go totally wild:
+    # cap to, say, 40 entries, so only the first 40 by that order are picked
+    # instead of sorting every row.
+    changed = df_detail[df_detail["changed"]]
+    picked = _first_by_name(changed, _DETAIL_ROW_LIMIT)
+    if len(picked) < _DETAIL_ROW_LIMIT:
+        rest = df_detail[~df_detail["changed"]]
+        picked = pd.concat(
+            [picked, _first_by_name(rest, _DETAIL_ROW_LIMIT - len(picked))]
+        )
+    df_detail = picked
 
-    # Don't go totally wild – cap to, say, 40 entries
-    return lines[:40]
+    names = df_detail["name"].str.strip().replace("", "(Unnamed App)")
+    overalls = df_detail["overall"].str.strip()
+    lines = np.where(overalls != "", names + " – " + overalls, names)
+    return lines.tolist()
 
 
 # ---------------------------------------------------------------------------
@@ -203,7 +408,12 @@ def _ensure_first_slide(prs: Presentation) -> Any:
 # ---------------------------------------------------------------------------
 # Helper: add or update a "detail" slide (2nd slide) with app list
 # ---------------------------------------------------------------------------
-def _add_detail_slide(prs: Presentation, df: pd.DataFrame, domain: str) -> None:
+def _add_detail_slide(
+    prs: Presentation,
+    df: pd.DataFrame,
+    domain: str,
+    changed_mask: Optional[np.ndarray] = None,
+) -> None:
     """
     Create / update a second slide with a list of applications and their
     OverallAssessment so that BRUM/MRUM decks clearly show live data.
@@ -242,7 +452,7 @@ def _add_detail_slide(prs: Presentation, df: pd.DataFrame, domain: str) -> None:
     tf = body_box.text_frame
     tf.clear()
 
-    lines = _build_detail_rows(df)
+    lines = _build_detail_rows(df, changed_mask)
     if not lines:
         p = tf.paragraphs[0]
         p.text = "No application rows found in Analysis sheet."
@@ -254,17 +464,81 @@ def _add_detail_slide(prs: Presentation, df: pd.DataFrame, domain: str) -> None:
     first.text = lines[0]
     first.font.size = Pt(18)
 
-    # Remaining lines as bullets
-    for line in lines[1:]:
-        p = tf.add_paragraph()
-        p.text = line
-        p.level = 0
-        p.font.size = Pt(16)
+    # Remaining lines as bullets: parse all the (16pt, level 0) paragraph
+    # skeletons as one fragment, then fill in each line's text
+    fragment = parse_xml(
+        f"<a:txBody {nsdecls('a')}>"
+        + '<a:p><a:pPr><a:defRPr sz="1600"/></a:pPr></a:p>' * (len(lines) - 1)
+        + "</a:txBody>"
+    )
+    txBody = tf._txBody
+    for p, line in zip(list(fragment), lines[1:]):
+        p.append_text(line)
+        txBody.append(p)
+
+
+# ---------------------------------------------------------------------------
+# Helper: crash-safe save
+# ---------------------------------------------------------------------------
+def _save_atomically(prs: Presentation, path: str) -> None:
+    """
+    Save the deck next to `path` and move it into place with os.replace, so
+    a failed save never leaves a truncated .pptx behind.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        prs.save(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
 
 
 # ---------------------------------------------------------------------------
 # Main entry point: generate_powerpoint_from_analysis
 # ---------------------------------------------------------------------------
+# Positional order shared by every generator entry point.
+_PPT_ARG_NAMES = (
+    "comparison_result_path",
+    "powerpoint_output_path",
+    "current_file_path",
+    "previous_file_path",
+)
+
+
+def _normalise_ppt_kwargs(args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Resolve both call styles -- positional
+    (comparison_result_path, powerpoint_output_path, current_file_path,
+    previous_file_path, domain, config) and keyword -- into one keyword dict.
+
+    `domain` comes back upper-cased (default 'APM'); unrecognised keyword
+    arguments are passed through untouched.
+    """
+    resolved = dict(kwargs)
+    for i, name in enumerate(_PPT_ARG_NAMES):
+        if resolved.get(name) is None and len(args) > i:
+            resolved[name] = args[i]
+        resolved.setdefault(name, None)
+    if resolved.get("domain") is None and len(args) > 4 and isinstance(args[4], str):
+        resolved["domain"] = args[4]
+    if resolved.get("config") is None and len(args) > 5 and isinstance(args[5], dict):
+        resolved["config"] = args[5]
+
+    if (
+        resolved["comparison_result_path"] is None
+        or resolved["powerpoint_output_path"] is None
+    ):
+        raise ValueError(
+            "comparison_result_path and powerpoint_output_path are required"
+        )
+
+    resolved["domain"] = (resolved.get("domain") or "APM").upper()
+    resolved.setdefault("config", None)
+    return resolved
+
+
 def generate_powerpoint_from_analysis(*args, **kwargs) -> str:
     """
     Domain-aware, but generic PowerPoint generator.
@@ -279,36 +553,23 @@ def generate_powerpoint_from_analysis(*args, **kwargs) -> str:
     It is forgiving about how it's called (positional vs keyword args) so it
     works both with older and newer service.run_comparison implementations.
     """
-
-    # ---- Normalise arguments (supports both old & new call styles) ---------
-    comparison_result_path = kwargs.pop("comparison_result_path", None)
-    powerpoint_output_path = kwargs.pop("powerpoint_output_path", None)
-    current_file_path = kwargs.pop("current_file_path", None)    # not used yet
-    previous_file_path = kwargs.pop("previous_file_path", None)  # not used yet
-    domain = kwargs.pop("domain", "APM")
-    config = kwargs.pop("config", None)
-
-    # Allow positional usage: (comparison_result_path, powerpoint_output_path, ...)
-    if comparison_result_path is None and len(args) > 0:
-        comparison_result_path = args[0]
-    if powerpoint_output_path is None and len(args) > 1:
-        powerpoint_output_path = args[1]
-    if current_file_path is None and len(args) > 2:
-        current_file_path = args[2]
-    if previous_file_path is None and len(args) > 3:
-        previous_file_path = args[3]
-    if len(args) > 4 and isinstance(args[4], str):
-        domain = args[4]
-    if len(args) > 5 and isinstance(args[5], dict):
-        config = args[5]
-
-    if comparison_result_path is None or powerpoint_output_path is None:
-        raise ValueError(
-            "comparison_result_path and powerpoint_output_path are required"
-        )
-
-    domain = (domain or "APM").upper()
-
+    return _generate_from_analysis(**_normalise_ppt_kwargs(args, kwargs))
+
+
+def _generate_from_analysis(
+    *,
+    comparison_result_path: str,
+    powerpoint_output_path: str,
+    current_file_path: Optional[str] = None,   # not used yet
+    previous_file_path: Optional[str] = None,  # not used yet
+    domain: str = "APM",
+    config: Optional[Dict[str, Any]] = None,
+    **_ignored: Any,
+) -> str:
+    """
+    generate_powerpoint_from_analysis() body, for already-normalised
+    arguments (see _normalise_ppt_kwargs).
+    """
     log.info(
         "Generating PPT (generic): domain=%s, comparison_result=%s, output=%s",
         domain,
@@ -322,18 +583,12 @@ def generate_powerpoint_from_analysis(*args, **kwargs) -> str:
     # Count apps (try to be robust to column naming)
     name_col = _find_name_column(df_analysis)
     if name_col:
-        total_apps = int(
-            df_analysis[name_col]
-            .dropna()
-            .astype(str)
-            .str.strip()
-            .ne("")
-            .sum()
-        )
+        total_apps = count_nonempty(df_analysis[name_col])
     else:
         total_apps = len(df_analysis)
 
-    overall = _count_overall(df_analysis)
+    improved_mask, degraded_mask = _change_masks(df_analysis)
+    overall = _count_overall(improved_mask, degraded_mask)
 
     log.info(
         "PPT stats: total_apps=%s, improved=%s, degraded=%s, result=%s, pct=%s",
@@ -348,7 +603,7 @@ def generate_powerpoint_from_analysis(*args, **kwargs) -> str:
     template_path = _pick_template_path(config, domain)
     if template_path and os.path.exists(template_path):
         log.info("Using PPT template: %s", template_path)
-        prs = Presentation(template_path)
+        prs = _open_template(template_path)
     else:
         log.warning(
             "No PPT template found (looked for %s). Using a blank presentation.",
@@ -402,11 +657,11 @@ def generate_powerpoint_from_analysis(*args, **kwargs) -> str:
     p3.font.size = Pt(20)
 
     # ---- Slide 2: application detail list ---------------------------------
-    _add_detail_slide(prs, df_analysis, domain)
+    _add_detail_slide(prs, df_analysis, domain, improved_mask | degraded_mask)
 
     # ---- Save and return path ---------------------------------------------
     os.makedirs(os.path.dirname(powerpoint_output_path), exist_ok=True)
-    prs.save(powerpoint_output_path)
+    _save_atomically(prs, powerpoint_output_path)
     log.info("PPT saved to %s", powerpoint_output_path)
 
     return powerpoint_output_path
@@ -429,36 +684,36 @@ def generate_powerpoint(*args, **kwargs) -> str:
     as generate_powerpoint_from_analysis.
     """
 
-    # Extract / normalise domain from kwargs or 5th positional argument
-    domain = kwargs.get("domain")
-    if domain is None and len(args) > 4 and isinstance(args[4], str):
-        domain = args[4]
-
-    domain_norm = (domain or "APM").upper()
+    # Normalise once; every backend below gets the resolved keywords
+    resolved = _normalise_ppt_kwargs(args, kwargs)
+    domain_norm = resolved["domain"]
 
     # BRUM
     if domain_norm == "BRUM" and generate_powerpoint_from_brum is not None:
         log.info("Dispatching to BRUM generator")
-        return generate_powerpoint_from_brum(*args, **kwargs)
+        # The legacy BRUM generator takes no `domain` argument
+        resolved.pop("domain")
+        return generate_powerpoint_from_brum(**resolved)
 
     # MRUM
     if domain_norm == "MRUM" and generate_powerpoint_from_mrum is not None:
         log.info("Dispatching to MRUM generator")
-        return generate_powerpoint_from_mrum(*args, **kwargs)
+        # The legacy MRUM generator takes no `domain` argument
+        resolved.pop("domain")
+        return generate_powerpoint_from_mrum(**resolved)
 
     # APM – if you have a dedicated APM generator, prefer that
     if domain_norm == "APM" and generate_powerpoint_from_apm is not None:
         log.info("Dispatching to APM generator")
-        return generate_powerpoint_from_apm(*args, **kwargs)
+        return generate_powerpoint_from_apm(**resolved)
 
     # Fallback: your existing generic implementation
     log.info(
         "Dispatching to generic Analysis-based PPT generator (domain=%s)",
         domain_norm,
     )
-    # Ensure the domain kwarg matches the normalised value for consistent behaviour
-    kwargs["domain"] = domain_norm
-    return generate_powerpoint_from_analysis(*args, **kwargs)
+    return _generate_from_analysis(**resolved)
+
 
 __all__ = [
     "generate_powerpoint",
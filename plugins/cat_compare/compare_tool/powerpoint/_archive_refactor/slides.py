@@ -85,7 +85,11 @@ def generate_powerpoint_for_channel(
         prs = load_template_presentation(cfg, config=config)
 
         # -------- Load data -------- #
-        df_current_analysis = pd.read_excel(current_file_path, sheet_name="Analysis")
+        # Open each workbook once and parse all of its sheets from that handle.
+        with pd.ExcelFile(current_file_path) as xl_current:
+            df_current_analysis = xl_current.parse("Analysis")
+            current_summary_df = xl_current.parse("Summary")
+
         number_of_apps = (
             df_current_analysis["name"]
             .dropna()
@@ -95,23 +99,22 @@ def generate_powerpoint_for_channel(
             .sum()
         )
 
-        current_summary_df = pd.read_excel(current_file_path, sheet_name="Summary")
-        previous_summary_df = pd.read_excel(previous_file_path, sheet_name="Summary")
-
-        summary_df = pd.read_excel(comparison_result_path, sheet_name="Summary")
-        df_analysis = pd.read_excel(comparison_result_path, sheet_name="Analysis")
-        df_network_requests = pd.read_excel(comparison_result_path, sheet_name=cfg.sheet_network)
-        df_health_rules = pd.read_excel(comparison_result_path, sheet_name=cfg.sheet_hra)
-
-        try:
-            curr_overall_df = pd.read_excel(comparison_result_path, sheet_name=cfg.sheet_overall)
-        except Exception:
-            curr_overall_df = pd.DataFrame()
-
-        try:
-            prev_overall_df = pd.read_excel(previous_file_path, sheet_name=cfg.sheet_overall)
-        except Exception:
-            prev_overall_df = pd.DataFrame()
+        with pd.ExcelFile(previous_file_path) as xl_previous:
+            previous_summary_df = xl_previous.parse("Summary")
+            try:
+                prev_overall_df = xl_previous.parse(cfg.sheet_overall)
+            except Exception:
+                prev_overall_df = pd.DataFrame()
+
+        with pd.ExcelFile(comparison_result_path) as xl_comparison:
+            summary_df = xl_comparison.parse("Summary")
+            df_analysis = xl_comparison.parse("Analysis")
+            df_network_requests = xl_comparison.parse(cfg.sheet_network)
+            df_health_rules = xl_comparison.parse(cfg.sheet_hra)
+            try:
+                curr_overall_df = xl_comparison.parse(cfg.sheet_overall)
+            except Exception:
+                curr_overall_df = pd.DataFrame()
 
         log.debug("%s Loaded comparison workbooks successfully.", log_prefix)
 
@@ -12,18 +12,34 @@ Key Features:
 - Saves the generated PowerPoint presentation to the specified output path.
 """
 
+import heapq
 import logging
 import os
 import re
+from xml.sax.saxutils import escape
 
 import pandas as pd
 from pptx import Presentation
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 
+from .base import EXCEL_ENGINE, count_nonempty
+
 log = logging.getLogger(__name__)
 log.info("[APM] apm.py imported")
 
+# Nite: Text columns go through pandas' Arrow-backed string dtype (its .str
+# methods run as Arrow kernels) when pyarrow is installed. Arrow string
+# columns reject compiled patterns: match them with plain str patterns.
+try:
+    import pyarrow  # noqa: F401
+
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    STRING_DTYPE = "string"
+
 # Nite: Optional config import – if your app has a central config, use it.
 try:
     # Adjust to your real config location if different
@@ -69,6 +85,9 @@ except Exception as e:  # pragma: no cover
         pass
 
 
+# Nite: Slide title text colour
+WHITE = RGBColor(255, 255, 255)
+
 # ---------------------------------------------------------------------------
 # Nite: Generic placeholder helpers used across many slides
 # ---------------------------------------------------------------------------
@@ -85,16 +104,53 @@ def find_table_placeholder_by_name(slide, name):
     return None
 
 
-def insert_table_at_placeholder(slide, placeholder_name, rows, cols):
+def shapes_by_name(slide, placeholders_only=False):
+    """
+    Nite: Map shape name -> shape with a single pass over slide.shapes.
+
+    When several shapes share a name the first one wins, matching the
+    linear scans above. Shapes added to the slide afterwards are not seen.
+    """
+    shapes = {}
+    for shape in slide.shapes:
+        if placeholders_only and not getattr(shape, "is_placeholder", False):
+            continue
+        shapes.setdefault(shape.name, shape)
+    return shapes
+
+
+def index_shapes(slide):
+    """
+    Nite: Build both shapes_by_name() maps (all shapes, placeholders only)
+    with one pass over slide.shapes.
+
+    Returns (shapes, placeholders).
+    """
+    shapes = {}
+    placeholders = {}
+    for shape in slide.shapes:
+        shapes.setdefault(shape.name, shape)
+        if getattr(shape, "is_placeholder", False):
+            placeholders.setdefault(shape.name, shape)
+    return shapes, placeholders
+
+
+def insert_table_at_placeholder(slide, placeholder_name, rows, cols, placeholders=None):
     """
     Nite: Insert a table at the position/dimensions of a named placeholder.
 
+    placeholders: optional prebuilt shapes_by_name(slide, placeholders_only=True)
+    map, so callers that already indexed the slide avoid another scan.
+
     Returns: the pptx.table.Table instance, or None if placeholder not found.
     """
-    placeholder = find_table_placeholder_by_name(slide, placeholder_name)
+    if placeholders is not None:
+        placeholder = placeholders.get(placeholder_name)
+    else:
+        placeholder = find_table_placeholder_by_name(slide, placeholder_name)
 
     if not placeholder:
-        logging.error(f"Placeholder '{placeholder_name}' not found on the slide.")
+        logging.error("Placeholder '%s' not found on the slide.", placeholder_name)
         return None
 
     left = placeholder.left
@@ -103,14 +159,452 @@ def insert_table_at_placeholder(slide, placeholder_name, rows, cols):
     height = placeholder.height
 
     logging.debug(
-        f"Inserting table at placeholder position: "
-        f"left={left}, top={top}, width={width}, height={height}"
+        "Inserting table at placeholder position: "
+        "left=%s, top=%s, width=%s, height=%s",
+        left,
+        top,
+        width,
+        height,
     )
 
     table_shape = slide.shapes.add_table(rows, cols, left, top, width, height)
     return table_shape.table
 
 
+def set_table_row_text(table, row_idx, values, size=None):
+    """
+    Nite: Replace the text of every cell in one table row.
+
+    Produces the same <a:p><a:r><a:t> markup as `cell.text = value` (plus
+    `cell.text_frame.paragraphs[0].font.size = size` when size is given), but
+    writes the row's <a:tc> elements directly instead of going through the
+    Cell / TextFrame / Font proxies for each assignment.
+    """
+    tr = table._tbl.tr_lst[row_idx]
+    for tc, value in zip(tr.tc_lst, values):
+        txBody = tc.get_or_add_txBody()
+        txBody.clear_content()
+        for p_text in value.split("\n"):
+            txBody.add_p().append_text(p_text)
+        if size is not None:
+            txBody.p_lst[0].get_or_add_pPr().get_or_add_defRPr().sz = size.centipoints
+
+
+# Nite: Characters python-pptx turns into extra paragraphs, <a:br/> or
+# _xHHHH_ escapes when writing text (see set_table_text).
+CONTROL_CHARS_RE = re.compile(r"[\x00-\x1f]")
+
+
+def set_table_text(table, rows, size=None):
+    """
+    Nite: Write rows of cell text into a table, starting at row 0.
+
+    Same markup as calling set_table_row_text() for each row, but the new
+    paragraphs of every cell come from one parsed XML fragment instead of
+    being built element by element. Text containing line breaks or other
+    control characters goes through set_table_row_text() as is.
+    """
+    rows = [list(values) for values in rows]
+    if any(CONTROL_CHARS_RE.search(value) for values in rows for value in values):
+        for row_idx, values in enumerate(rows):
+            set_table_row_text(table, row_idx, values, size=size)
+        return
+
+    cells = [
+        (tc, value)
+        for tr, values in zip(table._tbl.tr_lst, rows)
+        for tc, value in zip(tr.tc_lst, values)
+    ]
+    pPr = (
+        f'<a:pPr><a:defRPr sz="{size.centipoints}"/></a:pPr>'
+        if size is not None
+        else ""
+    )
+    fragment = parse_xml(
+        f"<a:txBody {nsdecls('a')}>"
+        + "".join(
+            f"<a:p>{pPr}<a:r><a:t>{escape(value)}</a:t></a:r></a:p>"
+            if value
+            else f"<a:p>{pPr}</a:p>"
+            for _, value in cells
+        )
+        + "</a:txBody>"
+    )
+    for (tc, _), p in zip(cells, list(fragment)):
+        txBody = tc.get_or_add_txBody()
+        txBody.clear_content()
+        txBody.append(p)
+
+
+def set_table_from_df(table, df, size=None):
+    """
+    Nite: Write a DataFrame into a table of len(df) + 1 rows: the column
+    names in row 0, then one row per record, every value as str(value).
+
+    Rows come from a single object-array conversion of the frame rather
+    than per-row pandas iteration.
+    """
+    header = [str(column) for column in df.columns]
+    body = [
+        [str(value) for value in row] for row in df.to_numpy(dtype=object).tolist()
+    ]
+    set_table_text(table, [header, *body], size=size)
+
+
+def set_shape_text(shape, text):
+    """
+    Nite: Set a shape's text, keeping the formatting of its first run.
+
+    When the shape already holds a run only that run's text is replaced and
+    anything after it is dropped; an empty frame falls back to
+    `shape.text = text`.
+    """
+    paragraphs = shape.text_frame.paragraphs
+    runs = paragraphs[0].runs if paragraphs else ()
+    if not runs:
+        shape.text = text
+        return
+
+    runs[0].text = text
+    for run in runs[1:]:
+        run._r.getparent().remove(run._r)
+    for paragraph in paragraphs[1:]:
+        paragraph._p.getparent().remove(paragraph._p)
+
+
+def set_title_text(placeholder, text, color=WHITE):
+    """
+    Nite: Set a title placeholder's text and colour every run of it.
+
+    Writes <a:solidFill><a:srgbClr/> into each run's <a:rPr> directly, the
+    same markup `run.font.color.rgb = color` produces, without building a
+    Font / ColorFormat proxy per run.
+    """
+    placeholder.text = text
+    for r in placeholder.text_frame._txBody.xpath("./a:p/a:r"):
+        solidFill = r.get_or_add_rPr().get_or_change_to_solidFill()
+        solidFill.get_or_change_to_srgbClr().val = str(color)
+
+
+# ---------------------------------------------------------------------------
+# Nite: Workbook loading
+# ---------------------------------------------------------------------------
+
+
+def read_sheets(path, sheet_names, optional=(), usecols=None, dtype=None):
+    """
+    Nite: Parse `sheet_names` from the workbook at `path`, opening it once.
+    Returns {sheet name: DataFrame}; sheets listed in `optional` come back
+    as None when they cannot be read instead of raising.
+
+    usecols maps a sheet name to the only columns to parse from that sheet
+    (columns the sheet lacks are skipped); other sheets are read whole.
+    dtype maps a sheet name to the `dtype` passed to its parse, so those
+    columns skip pandas' type inference.
+    """
+    usecols = usecols or {}
+    dtype = dtype or {}
+    sheets = {}
+    with pd.ExcelFile(path, engine=EXCEL_ENGINE) as xl:
+        for name in sheet_names:
+            wanted = frozenset(usecols.get(name, ()))
+            try:
+                sheets[name] = xl.parse(
+                    name,
+                    usecols=(lambda col: col in wanted) if wanted else None,
+                    dtype=dtype.get(name),
+                )
+            except Exception:
+                if name not in optional:
+                    raise
+                sheets[name] = None
+    return sheets
+
+
+# Nite: Analysis cells mention "Upgraded" / "Downgraded" (any case) when a
+# metric changed grade between the two runs.
+UPGRADED_RE = re.compile("upgraded", re.IGNORECASE)
+DOWNGRADED_RE = re.compile("downgraded", re.IGNORECASE)
+
+# Nite: Maturity grade named in a cell (the first one, if there are several).
+GRADE_TOKEN_RE = re.compile(r"(platinum|gold|silver|bronze)", re.IGNORECASE)
+
+
+# ---------------------------------------------------------------------------
+# Nite: “Downgrade summary” slides – one per APM area
+# ---------------------------------------------------------------------------
+
+# Maturity grades from best to worst; a higher rank is a lower grade.
+GRADE_RANK = {"platinum": 0, "gold": 1, "silver": 2, "bronze": 3}
+
+# "previous → current (...)" Analysis cell: two single-word grades around
+# exactly one arrow, the current grade optionally followed by " (note)".
+GRADE_TRANSITION_RE = re.compile(
+    r"^\s*([A-Za-z]+)\s*→\s*([A-Za-z]+)(?: [^→]*)?\s*$"
+)
+
+# Grades listed in the downgrade table (nothing can be downgraded *to* platinum)
+GRADES_FOR_TABLE = ("gold", "silver", "bronze")
+DOWNGRADE_TABLE_HEADERS = (
+    "Grade",
+    "Application Names",
+    "Number of Applications",
+    "Percentage Declined",
+)
+
+# (slide index, Analysis column / domain sheet, title, rectangles, keyword)
+# The rectangles map a domain-sheet column to the shape that shows how many
+# rows of that column contain the keyword.
+DOWNGRADE_SPECS = [
+    (
+        11,
+        "AppAgentsAPM",
+        "APM Agent - Downgrade Summary",
+        {
+            "percentAgentsLessThan1YearOld": "Rectangle 11",
+            "metricLimitNotHit": "Rectangle 10",
+            "percentAgentsLessThan2YearsOld": "Rectangle 12",
+            "percentAgentsReportingData": "Rectangle 13",
+            "percentAgentsRunningSameVersion": "Rectangle 14",
+        },
+        "declined",
+    ),
+    (
+        12,
+        "MachineAgentsAPM",
+        "Machine Agent - Downgrade Summary",
+        {
+            "percentAgentsLessThan1YearOld": "Rectangle 8",
+            "percentAgentsLessThan2YearsOld": "Rectangle 9",
+            "percentAgentsReportingData": "Rectangle 10",
+            "percentAgentsRunningSameVersion": "Rectangle 11",
+            "percentAgentsInstalledAlongsideAppAgents": "Rectangle 12",
+        },
+        "declined",
+    ),
+    (
+        13,
+        "BusinessTransactionsAPM",
+        "Business Transactions - Downgrade Summary",
+        {
+            "numberOfBTs": "Rectangle 17",
+            "percentBTsWithLoad": "Rectangle 18",
+            "btLockdownEnabled": "Rectangle 19",
+            "numberCustomMatchRules": "Rectangle 20",
+        },
+        "decreased",
+    ),
+    (
+        14,
+        "BackendsAPM",
+        "Backends - Downgrade Summary",
+        {
+            "percentBackendsWithLoad": "Rectangle 10",
+            "backendLimitNotHit": "Rectangle 11",
+            "numberOfCustomBackendRules": "Rectangle 12",
+        },
+        "decreased",
+    ),
+    (
+        15,
+        "ServiceEndpointsAPM",
+        "Service Endpoints - Downgrade Summary",
+        {
+            "numberOfCustomServiceEndpointRules": "Rectangle 10",
+            "serviceEndpointLimitNotHit": "Rectangle 11",
+            "percentServiceEndpointsWithLoadOrDisabled": "Rectangle 12",
+        },
+        "decreased",
+    ),
+    (
+        16,
+        "ErrorConfigurationAPM",
+        "Error Configuration - Downgrade Summary",
+        {
+            "successPercentageOfWorstTransaction": "Rectangle 10",
+            "numberOfCustomRules": "Rectangle 11",
+        },
+        "decreased",
+    ),
+    (
+        17,
+        "HealthRulesAndAlertingAPM",
+        "Health Rules & Alerting - Downgrade Summary",
+        {
+            "numberOfHealthRuleViolations": "Rectangle 10",
+            "numberOfDefaultHealthRulesModified": "Rectangle 11",
+            "numberOfActionsBoundToEnabledPolicies": "Rectangle 12",
+            "numberOfCustomHealthRules": "Rectangle 13",
+        },
+        "decreased",
+    ),
+    (
+        18,
+        "DataCollectorsAPM",
+        "Data Collectors - Downgrade Summary",
+        {
+            "numberOfDataCollectorFieldsConfigured": "Rectangle 10",
+            "numberOfDataCollectorFieldsCollectedInSnapshots": "Rectangle 11",
+            "numberOfDataCollectorFieldsCollectedInAnalytics": "Rectangle 12",
+            "biqEnabled": "Rectangle 13",
+        },
+        "decreased",
+    ),
+    (
+        19,
+        "DashboardsAPM",
+        "Dashboards - Downgrade Summary",
+        {
+            "numberOfDashboards": "Rectangle 10",
+            "percentageOfDashboardsModifiedLast6Months": "Rectangle 11",
+            "numberOfDashboardsUsingBiQ": "Rectangle 12",
+        },
+        "decreased",
+    ),
+    (
+        20,
+        "OverheadAPM",
+        "Overhead - Downgrade Summary",
+        {
+            "developerModeNotEnabledForAnyBT": "Rectangle 10",
+            "findEntryPointsNotEnabled": "Rectangle 11",
+            "aggressiveSnapshottingNotEnabled": "Rectangle 12",
+            "developerModeNotEnabledForApplication": "Rectangle 13",
+        },
+        "changed",
+    ),
+]
+
+
+def find_downgrades(df_analysis, columns):
+    """
+    Nite: Collect the downgraded applications of several Analysis columns
+    in one pass.
+
+    Returns {column: {grade: [application names]}} where grade is the
+    (lower-case) grade the application was downgraded *to*.
+    """
+    results = {column: {} for column in columns}
+
+    melted = df_analysis[["name", *columns]].melt(
+        id_vars="name", var_name="column", value_name="value"
+    )
+    values = melted["value"].astype(str)
+
+    # Most cells are unchanged grades; only parse the ones with an arrow
+    has_arrow = values.str.contains("→", regex=False)
+    if not has_arrow.any():
+        return results
+    melted = melted[has_arrow]
+
+    # Unknown grades (and unparsable cells) map to NaN and never compare
+    # as a downgrade
+    grades = values[has_arrow].str.extract(GRADE_TRANSITION_RE)
+    current_grade = grades[1].str.lower()
+    is_downgrade = (
+        grades[0].str.lower().map(GRADE_RANK) < current_grade.map(GRADE_RANK)
+    )
+
+    downgrades = pd.DataFrame(
+        {
+            "column": melted["column"][is_downgrade],
+            "grade": current_grade[is_downgrade],
+            # Stored as strings so the table row can join them directly
+            "name": melted["name"][is_downgrade].astype(str),
+        }
+    )
+
+    grouped = downgrades.groupby(["column", "grade"])["name"].agg(list)
+    for (column, grade), apps in grouped.items():
+        results[column][grade] = apps
+    return results
+
+
+def render_downgrade_slide(
+    slide,
+    downgraded_apps,
+    title,
+    columns_and_rectangles,
+    df_metrics,
+    keyword,
+    total_apps,
+):
+    """
+    Nite: Populate one “Downgrade summary” slide.
+
+    - fills a grade breakdown table from downgraded_apps
+      ({grade: [application names]}, see find_downgrades)
+    - updates the rectangles with the number of df_metrics rows whose
+      column contains `keyword` (e.g. "declined", "decreased", "changed")
+
+    total_apps is the number of Analysis rows the percentages are taken of.
+    """
+    shapes, placeholders = index_shapes(slide)
+
+    downgrade_placeholder = placeholders.get("Table Placeholder 1")
+    if downgrade_placeholder:
+        logging.debug("Found Downgrade table placeholder. Inserting table.")
+        table = insert_table_at_placeholder(
+            slide,
+            "Table Placeholder 1",
+            len(GRADES_FOR_TABLE) + 1,
+            4,
+            placeholders=placeholders,
+        )
+    else:
+        logging.warning(
+            "Downgrade table placeholder not found. Adding manually."
+        )
+        table = slide.shapes.add_table(
+            len(GRADES_FOR_TABLE) + 1,
+            4,
+            Inches(0.5),
+            Inches(1.5),
+            Inches(9),
+            Inches(4),
+        ).table
+
+    rows = [DOWNGRADE_TABLE_HEADERS]
+    for grade in GRADES_FOR_TABLE:
+        applications = downgraded_apps.get(grade, [])
+        number_of_apps = len(applications)
+        percentage = number_of_apps / total_apps * 100 if total_apps else 0
+        applications_str = ", ".join(applications) if applications else "None"
+        logging.debug("Grade: %s, Applications: %s", grade, applications_str)
+
+        rows.append(
+            (
+                grade.capitalize(),
+                applications_str,
+                str(number_of_apps),
+                f"{percentage:.2f}%",
+            )
+        )
+    set_table_text(table, rows)
+
+    title_placeholder = placeholders.get("Title 2")
+    if title_placeholder and hasattr(title_placeholder, "text_frame"):
+        set_title_text(title_placeholder, title)
+
+    declined_counts = (
+        df_metrics[list(columns_and_rectangles)]
+        .astype(STRING_DTYPE)
+        .apply(
+            lambda col: col.str.contains(keyword, case=False, regex=False, na=False)
+        )
+        .sum()
+        .astype(int)
+        .to_dict()
+    )
+
+    for metric, rectangle_name in columns_and_rectangles.items():
+        rectangle = shapes.get(rectangle_name)
+        if rectangle:
+            set_shape_text(rectangle, str(declined_counts[metric]))
+        else:
+            logging.warning("%s not found on slide '%s'.", rectangle_name, title)
+
+
 # ---------------------------------------------------------------------------
 # Nite: Main entry point for APM PPT generation
 # ---------------------------------------------------------------------------
@@ -151,7 +645,9 @@ def generate_powerpoint_from_apm(
                 )
 
         prs = Presentation(effective_template_path)
-        logging.debug(f"Template loaded from: {effective_template_path}")
+        logging.debug("Template loaded from: %s", effective_template_path)
+        # The deck never gains or loses slides, so resolve the list once
+        slides = list(prs.slides)
 
         # Deprecated
         # def generate_powerpoint_from_analysis(
@@ -173,60 +669,54 @@ def generate_powerpoint_from_apm(
 
 
         # -------------------------------------------------------------------
-        # Nite: Load Analysis from CURRENT workbook to drive counts & maturity
+        # Nite: Open each workbook once and parse every sheet needed from it
         # -------------------------------------------------------------------
-        df_current_analysis = pd.read_excel(current_file_path, sheet_name="Analysis")
+        # Only the comparison columns the slides below use: Analysis needs
+        # the app name, OverallAssessment and one column per area; each area
+        # sheet only the metrics shown on its downgrade slide. All of them
+        # are only ever matched as text, so none go through type inference.
+        analysis_columns = [
+            "name",
+            "OverallAssessment",
+            *(spec[1] for spec in DOWNGRADE_SPECS),
+        ]
+        # CURRENT: Analysis drives counts & maturity; Summary feeds Slide 5
+        current_sheets = read_sheets(current_file_path, ["Analysis", "Summary"])
+        # PREVIOUS: Summary, plus Analysis for the coverage call-out (optional)
+        previous_sheets = read_sheets(
+            previous_file_path, ["Summary", "Analysis"], optional=["Analysis"]
+        )
+        # COMPARISON: Summary, Analysis and the APM sheet of every area
+        comparison_sheets = read_sheets(
+            comparison_result_path,
+            ["Summary", "Analysis", *(spec[1] for spec in DOWNGRADE_SPECS)],
+            usecols={
+                "Analysis": analysis_columns,
+                **{spec[1]: list(spec[3]) for spec in DOWNGRADE_SPECS},
+            },
+            dtype={
+                "Analysis": dict.fromkeys(analysis_columns, STRING_DTYPE),
+                **{spec[1]: object for spec in DOWNGRADE_SPECS},
+            },
+        )
+
+        df_current_analysis = current_sheets["Analysis"]
+        current_summary_df = current_sheets["Summary"]
+        previous_summary_df = previous_sheets["Summary"]
+        df_previous_analysis = previous_sheets["Analysis"]
+        summary_df = comparison_sheets["Summary"]
+        df_analysis = comparison_sheets["Analysis"]
 
         # Count valid applications (non-empty 'name')
-        number_of_apps = (
-            df_current_analysis["name"].dropna().str.strip().ne("").sum()
-        )
+        number_of_apps = count_nonempty(df_current_analysis["name"])
         logging.info(
-            f"Number of applications in the current 'Analysis' sheet: {number_of_apps}"
+            "Number of applications in the current 'Analysis' sheet: %s",
+            number_of_apps,
         )
 
-        # -------------------------------------------------------------------
-        # Nite: Load summary sheets (current, previous, and comparison summary)
-        # -------------------------------------------------------------------
-        current_summary_df = pd.read_excel(current_file_path, sheet_name="Summary")
-        previous_summary_df = pd.read_excel(previous_file_path, sheet_name="Summary")
-
-        summary_df = pd.read_excel(comparison_result_path, sheet_name="Summary")
         logging.debug("Loaded Summary sheet successfully.")
-        logging.debug(f"Summary DataFrame head:\n{summary_df.head()}")
-
-        # -------------------------------------------------------------------
-        # Nite: Load comparison_result APM sheets for domain-specific slides
-        # -------------------------------------------------------------------
-        df_analysis = pd.read_excel(comparison_result_path, sheet_name="Analysis")
-        df_app_agents = pd.read_excel(comparison_result_path, sheet_name="AppAgentsAPM")
-        df_machine_agents = pd.read_excel(
-            comparison_result_path, sheet_name="MachineAgentsAPM"
-        )
-        df_BTs = pd.read_excel(
-            comparison_result_path, sheet_name="BusinessTransactionsAPM"
-        )
-        df_Backends = pd.read_excel(
-            comparison_result_path, sheet_name="BackendsAPM"
-        )
-        df_Overhead = pd.read_excel(
-            comparison_result_path, sheet_name="OverheadAPM"
-        )
-        df_ServiceEndpoints = pd.read_excel(
-            comparison_result_path, sheet_name="ServiceEndpointsAPM"
-        )
-        df_ErrorConfiguration = pd.read_excel(
-            comparison_result_path, sheet_name="ErrorConfigurationAPM"
-        )
-        df_HealthRulesAndAlerting = pd.read_excel(
-            comparison_result_path, sheet_name="HealthRulesAndAlertingAPM"
-        )
-        df_DataCollectors = pd.read_excel(
-            comparison_result_path, sheet_name="DataCollectorsAPM"
-        )
-        df_Dashboards = pd.read_excel(
-            comparison_result_path, sheet_name="DashboardsAPM"
-        )
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Summary DataFrame head:\n%s", summary_df.head())
 
         # -------------------------------------------------------------------
         # Nite: Local helpers for Slide 2 – Key Callouts + coverage
@@ -236,27 +726,20 @@ def generate_powerpoint_from_apm(
                 return None
             if isinstance(val, (int, float)):
                 return float(val)
-            s = str(val).strip()
-            if "→" in s:
-                s = s.split("→")[-1].strip()
+            # "prev% → curr%": keep the current side
+            s = str(val).rsplit("→", 1)[-1].strip()
             s = s.replace("%", "")
             try:
                 return float(s)
             except Exception:
                 return None
 
-        def _get_tier_percent(df, tier):
+        def _get_tier_percents(df, tiers=("Gold", "Platinum")):
+            # One lower-cased column map and one pass over the tier counts
+            # per Summary frame, shared by every requested tier.
             name_map = {c.lower(): c for c in df.columns}
-            candidates = [
-                f"{tier.lower()} %",
-                f"{tier.lower()}%",
-                f"percentage{tier.lower()}",
-                f"{tier.lower()}percentage",
-            ]
-            for cand in candidates:
-                if cand in name_map:
-                    return _parse_percent_to_float(df[name_map[cand]].iloc[0])
 
+            shares = None
             needed = ["bronze", "silver", "gold", "platinum"]
             if all(k in name_map for k in needed):
                 try:
@@ -269,10 +752,28 @@ def generate_powerpoint_from_apm(
                         counts[k] = 0.0 if pd.isna(val) else float(val)
                         total += counts[k]
                     if total > 0:
-                        return (counts[tier.lower()] / total) * 100.0
+                        shares = {k: (v / total) * 100.0 for k, v in counts.items()}
                 except Exception:
-                    return None
-            return None
+                    shares = None
+
+            percents = []
+            for tier in tiers:
+                tier = tier.lower()
+                candidates = [
+                    f"{tier} %",
+                    f"{tier}%",
+                    f"percentage{tier}",
+                    f"{tier}percentage",
+                ]
+                for cand in candidates:
+                    if cand in name_map:
+                        percents.append(
+                            _parse_percent_to_float(df[name_map[cand]].iloc[0])
+                        )
+                        break
+                else:
+                    percents.append(shares.get(tier) if shares else None)
+            return percents
 
         def _arrow(curr, prev):
             if curr is None or prev is None:
@@ -300,24 +801,20 @@ def generate_powerpoint_from_apm(
         def _grade_token(s: str):
             if not s:
                 return None
-            m = re.search(r"(platinum|gold|silver|bronze)", str(s), re.I)
+            m = GRADE_TOKEN_RE.search(str(s))
             return m.group(1).lower() if m else None
 
-        def _apps_coverage(path):
+        def _apps_coverage(df):
             try:
-                df = pd.read_excel(path, sheet_name="Analysis")
-                total = int(
-                    df["name"]
-                    .dropna()
-                    .astype(str)
-                    .str.strip()
-                    .ne("")
-                    .sum()
-                )
+                total = count_nonempty(df["name"])
                 if total == 0:
                     return (0, 0, 0.0)
                 rated = int(
-                    df["OverallAssessment"].apply(_grade_token).notna().sum()
+                    df["OverallAssessment"]
+                    .astype(str)
+                    .str.extract(GRADE_TOKEN_RE, expand=False)
+                    .notna()
+                    .sum()
                 )
                 pct = (rated / total) * 100.0
                 return (total, rated, pct)
@@ -358,15 +855,14 @@ def generate_powerpoint_from_apm(
         # -------------------------------------------------------------------
         # Nite: Slide 2 (index 1) — Assessment Result - Key Callouts
         # -------------------------------------------------------------------
-        slide = prs.slides[1]
+        slide = slides[1]
+        placeholders = shapes_by_name(slide, placeholders_only=True)
 
-        curr_gold = _get_tier_percent(current_summary_df, "Gold")
-        prev_gold = _get_tier_percent(previous_summary_df, "Gold")
-        curr_plat = _get_tier_percent(current_summary_df, "Platinum")
-        prev_plat = _get_tier_percent(previous_summary_df, "Platinum")
+        curr_gold, curr_plat = _get_tier_percents(current_summary_df)
+        prev_gold, prev_plat = _get_tier_percents(previous_summary_df)
 
-        total_prev, rated_prev, cov_prev = _apps_coverage(previous_file_path)
-        total_curr, rated_curr, cov_curr = _apps_coverage(current_file_path)
+        total_prev, rated_prev, cov_prev = _apps_coverage(df_previous_analysis)
+        total_curr, rated_curr, cov_curr = _apps_coverage(df_current_analysis)
         cov_arrow = _arrow_threshold(cov_curr, cov_prev)
 
         cov_outcome = (
@@ -378,20 +874,15 @@ def generate_powerpoint_from_apm(
         if cov_prev_curr:
             cov_outcome = f"{cov_outcome} {cov_prev_curr}"
 
-        try:
-            df_cmp = pd.read_excel(comparison_result_path, sheet_name="Analysis")
-        except Exception:
-            df_cmp = None
-
         def _count_changes(df, col):
             if df is None or col not in df.columns:
                 return 0, 0
             s = df[col].astype(str)
-            up = s.str.contains("Upgraded", case=False, na=False).sum()
-            down = s.str.contains("Downgraded", case=False, na=False).sum()
+            up = s.str.contains(UPGRADED_RE, na=False).sum()
+            down = s.str.contains(DOWNGRADED_RE, na=False).sum()
             return int(up), int(down)
 
-        up_overall, down_overall = _count_changes(df_cmp, "OverallAssessment")
+        up_overall, down_overall = _count_changes(df_analysis, "OverallAssessment")
         overall_result_text = (
             "Increase"
             if up_overall > down_overall
@@ -424,15 +915,20 @@ def generate_powerpoint_from_apm(
             "DataCollectorsAPM": "Data Collectors",
             "DashboardsAPM": "Dashboards",
         }
-        downgraded_counts = []
-        if df_cmp is not None:
-            for col in area_cols:
-                if col in df_cmp.columns:
-                    s = df_cmp[col].astype(str)
-                    cnt = s.str.contains("Downgraded", case=False, na=False).sum()
-                    downgraded_counts.append((col, int(cnt)))
-        downgraded_counts.sort(key=lambda x: x[1], reverse=True)
-        focus_list = [pretty[c] for c, n in downgraded_counts if n > 0][:2]
+        present_cols = [col for col in area_cols if col in df_analysis.columns]
+        counts = (
+            df_analysis[present_cols]
+            .astype(str)
+            .apply(lambda col: col.str.contains(DOWNGRADED_RE, na=False))
+            .sum()
+        )
+        # The two areas with the most downgrades (ties keep area order)
+        top_downgraded = heapq.nlargest(
+            2,
+            ((col, int(counts[col])) for col in present_cols if counts[col] > 0),
+            key=lambda x: x[1],
+        )
+        focus_list = [pretty[c] for c, _ in top_downgraded]
         next_focus_text = (
             ", ".join(focus_list) if focus_list else "Maintain current progress"
         )
@@ -478,10 +974,14 @@ def generate_powerpoint_from_apm(
             ],
         ]
 
-        key_callouts_ph = find_table_placeholder_by_name(slide, "Table Placeholder 1")
+        key_callouts_ph = placeholders.get("Table Placeholder 1")
         if key_callouts_ph:
             table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(rows) + 1, len(headers)
+                slide,
+                "Table Placeholder 1",
+                len(rows) + 1,
+                len(headers),
+                placeholders=placeholders,
             )
         else:
             table = (
@@ -529,14 +1029,18 @@ def generate_powerpoint_from_apm(
             )
 
         def _tier_counts(df):
-            counts = {"bronze": 0, "silver": 0, "gold": 0, "platinum": 0}
+            tiers = ("bronze", "silver", "gold", "platinum")
             col = "OverallAssessment"
             if df is None or col not in df.columns:
-                return counts, 0
-            for v in df[col]:
-                t = _grade_token(v)
-                if t in counts:
-                    counts[t] += 1
+                return dict.fromkeys(tiers, 0), 0
+            found = (
+                df[col]
+                .astype(str)
+                .str.extract(GRADE_TOKEN_RE, expand=False)
+                .str.lower()
+                .value_counts()
+            )
+            counts = {t: int(found.get(t, 0)) for t in tiers}
             total = sum(counts.values())
             return counts, total
 
@@ -586,38 +1090,32 @@ def generate_powerpoint_from_apm(
         # -------------------------------------------------------------------
         # Nite: Slide 4 – Upgraded applications list + count in TextBox 7
         # -------------------------------------------------------------------
-        slide = prs.slides[3]
-        upgraded_apps = df_analysis[
-            df_analysis["OverallAssessment"].str.contains(
-                "upgraded", case=False, na=False
-            )
-        ]["name"].tolist()
-
-        current_analysis_df = pd.read_excel(
-            current_file_path, sheet_name="Analysis"
+        slide = slides[3]
+        shapes, placeholders = index_shapes(slide)
+        upgraded_mask = df_analysis["OverallAssessment"].str.contains(
+            "upgraded", case=False, regex=False, na=False
         )
-        number_of_apps = len(current_analysis_df)
+        upgraded_apps = df_analysis.loc[upgraded_mask, "name"].to_numpy()
 
-        textbox_7 = None
-        for shape in slide.shapes:
-            if shape.name == "TextBox 7":
-                textbox_7 = shape
-                break
+        number_of_apps = len(df_current_analysis)
 
+        textbox_7 = shapes.get("TextBox 7")
         if textbox_7:
             textbox_7.text = f"{number_of_apps}"
         else:
             logging.warning("TextBox 8 not found on Slide 3.")
 
-        upgraded_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
+        upgraded_placeholder = placeholders.get("Table Placeholder 1")
         if upgraded_placeholder:
             logging.debug(
                 "Found Upgraded Applications table placeholder. Inserting table."
             )
             table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(upgraded_apps) + 1, 1
+                slide,
+                "Table Placeholder 1",
+                len(upgraded_apps) + 1,
+                1,
+                placeholders=placeholders,
             )
         else:
             logging.warning(
@@ -632,26 +1130,31 @@ def generate_powerpoint_from_apm(
                 Inches(4),
             ).table
 
-        table.cell(0, 0).text = "Applications with Upgraded Metrics"
-        table.cell(0, 0).text_frame.paragraphs[0].font.size = Pt(12)
-
-        for idx, app in enumerate(upgraded_apps):
-            table.cell(idx + 1, 0).text = app
-            table.cell(idx + 1, 0).text_frame.paragraphs[0].font.size = Pt(12)
+        set_table_text(
+            table,
+            [
+                ("Applications with Upgraded Metrics",),
+                *((app,) for app in upgraded_apps),
+            ],
+            size=Pt(12),
+        )
 
         # -------------------------------------------------------------------
         # Nite: Slide 5 – Comparison summary + previous vs current summary tables
         # -------------------------------------------------------------------
-        slide = prs.slides[4]
-        summary_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
+        slide = slides[4]
+        placeholders = shapes_by_name(slide, placeholders_only=True)
+        summary_placeholder = placeholders.get("Table Placeholder 1")
 
         # Nite: main comparison Result Summary table
         if summary_placeholder:
             logging.debug("Found Summary table placeholder. Inserting table.")
             table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(summary_df) + 1, len(summary_df.columns)
+                slide,
+                "Table Placeholder 1",
+                len(summary_df) + 1,
+                len(summary_df.columns),
+                placeholders=placeholders,
             )
         else:
             logging.warning(
@@ -666,21 +1169,10 @@ def generate_powerpoint_from_apm(
                 Inches(4),
             ).table
 
-        for col_idx, column in enumerate(summary_df.columns):
-            table.cell(0, col_idx).text = str(column)
-            table.cell(0, col_idx).text_frame.paragraphs[0].font.size = Pt(12)
-
-        for row_idx, row in summary_df.iterrows():
-            for col_idx, value in enumerate(row):
-                table.cell(row_idx + 1, col_idx).text = str(value)
-                table.cell(row_idx + 1, col_idx).text_frame.paragraphs[
-                    0
-                ].font.size = Pt(12)
+        set_table_from_df(table, summary_df, size=Pt(12))
 
         # Nite: previous summary mini-table (Table Placeholder 4)
-        summary_placeholder_previous = find_table_placeholder_by_name(
-            slide, "Table Placeholder 4"
-        )
+        summary_placeholder_previous = placeholders.get("Table Placeholder 4")
         if summary_placeholder_previous:
             logging.debug("Found Table Placeholder 4. Inserting table for previous summary.")
             table_previous = insert_table_at_placeholder(
@@ -688,6 +1180,7 @@ def generate_powerpoint_from_apm(
                 "Table Placeholder 4",
                 len(previous_summary_df) + 1,
                 len(previous_summary_df.columns),
+                placeholders=placeholders,
             )
         else:
             logging.warning("Table Placeholder 4 not found. Adding manually.")
@@ -700,23 +1193,10 @@ def generate_powerpoint_from_apm(
                 Inches(4),
             ).table
 
-        for col_idx, column in enumerate(previous_summary_df.columns):
-            table_previous.cell(0, col_idx).text = str(column)
-            table_previous.cell(0, col_idx).text_frame.paragraphs[
-                0
-            ].font.size = Pt(12)
-
-        for row_idx, row in previous_summary_df.iterrows():
-            for col_idx, value in enumerate(row):
-                table_previous.cell(row_idx + 1, col_idx).text = str(value)
-                table_previous.cell(row_idx + 1, col_idx).text_frame.paragraphs[
-                    0
-                ].font.size = Pt(12)
+        set_table_from_df(table_previous, previous_summary_df, size=Pt(12))
 
         # Nite: current summary mini-table (Table Placeholder 3)
-        summary_placeholder_current = find_table_placeholder_by_name(
-            slide, "Table Placeholder 3"
-        )
+        summary_placeholder_current = placeholders.get("Table Placeholder 3")
         if summary_placeholder_current:
             logging.debug("Found Table Placeholder 3. Inserting table for current summary.")
             table_current = insert_table_at_placeholder(
@@ -724,6 +1204,7 @@ def generate_powerpoint_from_apm(
                 "Table Placeholder 3",
                 len(current_summary_df) + 1,
                 len(current_summary_df.columns),
+                placeholders=placeholders,
             )
         else:
             logging.warning("Table Placeholder 3 not found. Adding manually.")
@@ -736,30 +1217,16 @@ def generate_powerpoint_from_apm(
                 Inches(4),
             ).table
 
-        for col_idx, column in enumerate(current_summary_df.columns):
-            table_current.cell(0, col_idx).text = str(column)
-            table_current.cell(0, col_idx).text_frame.paragraphs[
-                0
-            ].font.size = Pt(12)
-
-        for row_idx, row in current_summary_df.iterrows():
-            for col_idx, value in enumerate(row):
-                table_current.cell(row_idx + 1, col_idx).text = str(value)
-                table_current.cell(row_idx + 1, col_idx).text_frame.paragraphs[
-                    0
-                ].font.size = Pt(12)
+        set_table_from_df(table_current, current_summary_df, size=Pt(12))
 
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
+        title_placeholder = placeholders.get("Title 2")
         if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "Comparison Summary"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
+            set_title_text(title_placeholder, "Comparison Summary")
 
         # -------------------------------------------------------------------
         # Nite: Overall / per-area upgraded vs downgraded counts for Slides 7 & 8
         # -------------------------------------------------------------------
-        df = pd.read_excel(comparison_result_path, sheet_name="Analysis")
+        df = df_analysis
         columns = [
             "AppAgentsAPM",
             "MachineAgentsAPM",
@@ -774,19 +1241,20 @@ def generate_powerpoint_from_apm(
             "OverallAssessment",
         ]
 
-        results = {}
         total_applications = len(df)
 
-        for col in columns:
-            df[col] = df[col].astype(str)
-            upgraded_count = df[col].str.contains(
-                "upgraded", case=False, na=False
-            ).sum()
-            downgraded_count = df[col].str.contains(
-                "downgraded", case=False, na=False
-            ).sum()
+        # Coerce all the columns once, match each marker over the whole block
+        # in a single pass, then sum the matches per column
+        cells = pd.Series(df[columns].astype(str).to_numpy().ravel())
+        block = (total_applications, len(columns))
+        upgraded_totals = (
+            cells.str.contains(UPGRADED_RE).to_numpy().reshape(block).sum(axis=0)
+        )
+        downgraded_totals = (
+            cells.str.contains(DOWNGRADED_RE).to_numpy().reshape(block).sum(axis=0)
+        )
 
-            total_applications = len(df[col])
+        def _result(upgraded_count, downgraded_count):
             overall_result = (
                 "Increase"
                 if upgraded_count > downgraded_count
@@ -799,24 +1267,29 @@ def generate_powerpoint_from_apm(
                 if overall_result == "Even"
                 else round((upgraded_count / total_applications) * 100)
             )
-
-            results[col] = {
+            return {
                 "upgraded": upgraded_count,
                 "downgraded": downgraded_count,
                 "overall_result": overall_result,
                 "percentage": percentage_value,
             }
 
+        results = {
+            col: _result(int(up), int(down))
+            for col, up, down in zip(columns, upgraded_totals, downgraded_totals)
+        }
+
         # -------------------------------------------------------------------
         # Nite: Slide 7 – Overall Assessment Result table
         # -------------------------------------------------------------------
-        slide = prs.slides[6]
-        overall_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
+        slide = slides[6]
+        placeholders = shapes_by_name(slide, placeholders_only=True)
+        overall_placeholder = placeholders.get("Table Placeholder 1")
 
         if overall_placeholder:
-            table = insert_table_at_placeholder(slide, "Table Placeholder 1", 2, 5)
+            table = insert_table_at_placeholder(
+                slide, "Table Placeholder 1", 2, 5, placeholders=placeholders
+            )
         else:
             table = slide.shapes.add_table(
                 2, 5, Inches(0.5), Inches(1.5), Inches(9), Inches(1.5)
@@ -829,42 +1302,46 @@ def generate_powerpoint_from_apm(
             "Overall Result",
             "Percentage Value",
         ]
-        for col_idx, header in enumerate(headers):
-            table.cell(0, col_idx).text = header
-            table.cell(0, col_idx).text_frame.paragraphs[0].font.size = Pt(14)
+        set_table_row_text(table, 0, headers, size=Pt(14))
 
         overall_assessment = results["OverallAssessment"]
-        table.cell(1, 0).text = "OverallAssessment"
-        table.cell(1, 1).text = str(overall_assessment["upgraded"])
-        table.cell(1, 2).text = str(overall_assessment["downgraded"])
-        table.cell(1, 3).text = overall_assessment["overall_result"]
-        table.cell(1, 4).text = f"{overall_assessment['percentage']}%"
+        set_table_row_text(
+            table,
+            1,
+            (
+                "OverallAssessment",
+                str(overall_assessment["upgraded"]),
+                str(overall_assessment["downgraded"]),
+                overall_assessment["overall_result"],
+                f"{overall_assessment['percentage']}%",
+            ),
+        )
 
         if overall_assessment["overall_result"] == "Increase":
             table.cell(1, 4).fill.solid()
             table.cell(1, 4).fill.fore_color.rgb = RGBColor(0, 255, 0)
 
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
+        title_placeholder = placeholders.get("Title 2")
         if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "Overall Assessment Result"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
+            set_title_text(title_placeholder, "Overall Assessment Result")
 
         # -------------------------------------------------------------------
         # Nite: Slide 8 – Status table per APM domain
         # -------------------------------------------------------------------
-        slide = prs.slides[7]
-        status_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
+        slide = slides[7]
+        placeholders = shapes_by_name(slide, placeholders_only=True)
+        status_placeholder = placeholders.get("Table Placeholder 1")
 
         num_rows = len(columns)
         num_cols = 5
 
         if status_placeholder:
             table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", num_rows, num_cols
+                slide,
+                "Table Placeholder 1",
+                num_rows,
+                num_cols,
+                placeholders=placeholders,
             )
         else:
             table = slide.shapes.add_table(
@@ -878,1413 +1355,56 @@ def generate_powerpoint_from_apm(
             "Overall Result",
             "Percentage Value",
         ]
-        for col_idx, header in enumerate(headers):
-            table.cell(0, col_idx).text = header
-            table.cell(0, col_idx).text_frame.paragraphs[0].font.size = Pt(14)
+        set_table_row_text(table, 0, headers, size=Pt(14))
 
         for i, col in enumerate(columns[:-1]):
-            table.cell(i + 1, 0).text = col
-            table.cell(i + 1, 1).text = str(results[col]["upgraded"])
-            table.cell(i + 1, 2).text = str(results[col]["downgraded"])
-            table.cell(i + 1, 3).text = results[col]["overall_result"]
-            table.cell(i + 1, 4).text = f"{results[col]['percentage']}%"
+            set_table_row_text(
+                table,
+                i + 1,
+                (
+                    col,
+                    str(results[col]["upgraded"]),
+                    str(results[col]["downgraded"]),
+                    results[col]["overall_result"],
+                    f"{results[col]['percentage']}%",
+                ),
+            )
 
             if results[col]["overall_result"] == "Increase":
                 table.cell(i + 1, 4).fill.solid()
                 table.cell(i + 1, 4).fill.fore_color.rgb = RGBColor(0, 255, 0)
 
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
+        title_placeholder = placeholders.get("Title 2")
         if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "APM Maturity Assessment Result"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-
-        # -------------------------------------------------------------------
-        # Nite: From here down – “Downgrade summary” slides for each APM area
-        # Each block:
-        #   - finds downgrades in df_analysis[column]
-        #   - fills a grade breakdown table
-        #   - updates “Declined/Decreased/Changed” rectangles from domain sheet
-        # -------------------------------------------------------------------
+            set_title_text(title_placeholder, "APM Maturity Assessment Result")
 
         # -------------------------------------------------------------------
-        # Nite: Slide 12 – App Agents Downgrade Summary + rectangles
+        # Nite: Slides 12–21 – “Downgrade summary” slide for each APM area,
+        # driven by DOWNGRADE_SPECS (see render_downgrade_slide)
         # -------------------------------------------------------------------
-        slide = prs.slides[11]
-
-        all_grades = ["platinum", "gold", "silver", "bronze"]
-        grades_for_table = ["gold", "silver", "bronze"]
-        downgrade_data = {
-            grade: {"applications": [], "number_of_apps": 0, "percentage": 0}
-            for grade in grades_for_table
-        }
-
-        for _, row in df_analysis.iterrows():
-            current_value = row["AppAgentsAPM"]
-            app_name = row["name"]
-            logging.debug(f"Checking App: {app_name} - Current Value: {current_value}")
-
-            if "→" in str(current_value):
-                logging.debug(f"Found potential Downgrade in {app_name}: {current_value}")
-                try:
-                    previous_value, current_grade = current_value.split("→")
-                    previous_value = previous_value.strip().lower()
-                    current_grade = current_grade.strip().lower().split(" ")[0]
-
-                    logging.debug(
-                        f"Extracted: Previous Value: {previous_value}, "
-                        f"Current Grade: {current_grade}"
-                    )
-
-                    if previous_value in all_grades and current_grade in all_grades:
-                        if all_grades.index(previous_value) < all_grades.index(current_grade):
-                            logging.debug(
-                                f"Adding {app_name} to {current_grade} downgrade list"
-                            )
-                            downgrade_data[current_grade]["applications"].append(app_name)
-                            downgrade_data[current_grade]["number_of_apps"] += 1
-                        else:
-                            logging.debug(
-                                f"Not a downgrade for {app_name}: "
-                                f"{previous_value} → {current_grade}"
-                            )
-                    else:
-                        logging.debug(
-                            f"Invalid grades for downgrade comparison: "
-                            f"{previous_value}, {current_grade}"
-                        )
-                except Exception as e:
-                    logging.error(f"Error processing downgrade for {app_name}: {e}")
-            else:
-                logging.debug(
-                    f"No Downgrade for App: {app_name} - Current Value: {current_value}"
-                )
-
-        for grade in grades_for_table:
-            logging.debug(
-                f"Applications for {grade}: {downgrade_data[grade]['applications']}"
-            )
-
         total_apps = len(df_analysis)
-        for grade in grades_for_table:
-            downgrade_data[grade]["percentage"] = (
-                len(downgrade_data[grade]["applications"]) / total_apps * 100
-                if total_apps
-                else 0
-            )
-
-        downgrade_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
+        downgrades = find_downgrades(
+            df_analysis, [spec[1] for spec in DOWNGRADE_SPECS]
         )
-        if downgrade_placeholder:
-            logging.debug("Found Downgrade table placeholder. Inserting table.")
-            table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(grades_for_table) + 1, 4
-            )
-        else:
-            logging.warning(
-                "Downgrade table placeholder not found. Adding manually."
-            )
-            table = slide.shapes.add_table(
-                len(grades_for_table) + 1,
-                4,
-                Inches(0.5),
-                Inches(1.5),
-                Inches(9),
-                Inches(4),
-            ).table
-
-        table.cell(0, 0).text = "Grade"
-        table.cell(0, 1).text = "Application Names"
-        table.cell(0, 2).text = "Number of Applications"
-        table.cell(0, 3).text = "Percentage Declined"
-
-        for i, grade in enumerate(grades_for_table):
-            table.cell(i + 1, 0).text = grade.capitalize()
-            table.cell(i + 1, 1).text = (
-                ", ".join(downgrade_data[grade]["applications"])
-                if downgrade_data[grade]["applications"]
-                else "None"
-            )
-            table.cell(i + 1, 2).text = str(
-                downgrade_data[grade]["number_of_apps"]
-            )
-            table.cell(i + 1, 3).text = (
-                f"{downgrade_data[grade]['percentage']:.2f}%"
-            )
-
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
-        if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "APM Agent - Downgrade Summary"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-
-        columns_and_rectangles = {
-            "percentAgentsLessThan1YearOld": "Rectangle 11",
-            "metricLimitNotHit": "Rectangle 10",
-            "percentAgentsLessThan2YearsOld": "Rectangle 12",
-            "percentAgentsReportingData": "Rectangle 13",
-            "percentAgentsRunningSameVersion": "Rectangle 14",
-        }
-        declined_counts = {key: 0 for key in columns_and_rectangles}
-
-        for _, row in df_app_agents.iterrows():
-            for column, _rectangle in columns_and_rectangles.items():
-                if "declined" in str(row[column]).lower():
-                    declined_counts[column] += 1
-
-        for column, rectangle_name in columns_and_rectangles.items():
-            rectangle = None
-            for shape in slide.shapes:
-                if shape.name == rectangle_name:
-                    rectangle = shape
-                    break
-            if rectangle:
-                rectangle.text = f"{declined_counts[column]}"
-            else:
-                logging.warning(f"{rectangle_name} not found on Slide 15.")
-
-        # -------------------------------------------------------------------
-        # Nite: Slide 13 – Machine Agents Downgrade Summary + rectangles
-        # -------------------------------------------------------------------
-        slide = prs.slides[12]
-
-        all_grades = ["platinum", "gold", "silver", "bronze"]
-        grades_for_table = ["gold", "silver", "bronze"]
-        downgrade_data = {
-            grade: {"applications": [], "number_of_apps": 0, "percentage": 0}
-            for grade in grades_for_table
-        }
-
-        for _, row in df_analysis.iterrows():
-            current_value = row["MachineAgentsAPM"]
-            app_name = row["name"]
-            logging.debug(f"Checking App: {app_name} - Current Value: {current_value}")
-
-            if "→" in str(current_value):
-                logging.debug(f"Found potential Downgrade in {app_name}: {current_value}")
-                try:
-                    previous_value, current_grade = current_value.split("→")
-                    previous_value = previous_value.strip().lower()
-                    current_grade = current_grade.strip().lower().split(" ")[0]
-
-                    logging.debug(
-                        f"Extracted: Previous Value: {previous_value}, "
-                        f"Current Grade: {current_grade}"
-                    )
-
-                    if previous_value in all_grades and current_grade in all_grades:
-                        if all_grades.index(previous_value) < all_grades.index(current_grade):
-                            logging.debug(
-                                f"Adding {app_name} to {current_grade} downgrade list"
-                            )
-                            downgrade_data[current_grade]["applications"].append(app_name)
-                            downgrade_data[current_grade]["number_of_apps"] += 1
-                        else:
-                            logging.debug(
-                                f"Not a downgrade for {app_name}: "
-                                f"{previous_value} → {current_grade}"
-                            )
-                    else:
-                        logging.debug(
-                            f"Invalid grades for downgrade comparison: "
-                            f"{previous_value}, {current_grade}"
-                        )
-                except Exception as e:
-                    logging.error(f"Error processing downgrade for {app_name}: {e}")
-            else:
-                logging.debug(
-                    f"No Downgrade for App: {app_name} - Current Value: {current_value}"
-                )
 
-        for grade in grades_for_table:
-            logging.debug(
-                f"Applications for {grade}: {downgrade_data[grade]['applications']}"
-            )
-
-        total_apps = len(df_analysis)
-        for grade in grades_for_table:
-            downgrade_data[grade]["percentage"] = (
-                len(downgrade_data[grade]["applications"]) / total_apps * 100
-                if total_apps
-                else 0
+        for slide_idx, column, title, rectangles, keyword in DOWNGRADE_SPECS:
+            render_downgrade_slide(
+                slides[slide_idx],
+                downgrades[column],
+                title,
+                rectangles,
+                comparison_sheets[column],
+                keyword,
+                total_apps,
             )
 
-        downgrade_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
-        if downgrade_placeholder:
-            logging.debug("Found Downgrade table placeholder. Inserting table.")
-            table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(grades_for_table) + 1, 4
-            )
-        else:
-            logging.warning(
-                "Downgrade table placeholder not found. Adding manually."
-            )
-            table = slide.shapes.add_table(
-                len(grades_for_table) + 1,
-                4,
-                Inches(0.5),
-                Inches(1.5),
-                Inches(9),
-                Inches(4),
-            ).table
-
-        table.cell(0, 0).text = "Grade"
-        table.cell(0, 1).text = "Application Names"
-        table.cell(0, 2).text = "Number of Applications"
-        table.cell(0, 3).text = "Percentage Declined"
-
-        for i, grade in enumerate(grades_for_table):
-            table.cell(i + 1, 0).text = grade.capitalize()
-            table.cell(i + 1, 1).text = (
-                ", ".join(downgrade_data[grade]["applications"])
-                if downgrade_data[grade]["applications"]
-                else "None"
-            )
-            table.cell(i + 1, 2).text = str(
-                downgrade_data[grade]["number_of_apps"]
-            )
-            table.cell(i + 1, 3).text = (
-                f"{downgrade_data[grade]['percentage']:.2f}%"
-            )
-
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
-        if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "Machine Agent - Downgrade Summary"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-
-        columns_and_rectangles = {
-            "percentAgentsLessThan1YearOld": "Rectangle 8",
-            "percentAgentsLessThan2YearsOld": "Rectangle 9",
-            "percentAgentsReportingData": "Rectangle 10",
-            "percentAgentsRunningSameVersion": "Rectangle 11",
-            "percentAgentsInstalledAlongsideAppAgents": "Rectangle 12",
-        }
-        declined_counts = {key: 0 for key in columns_and_rectangles}
-
-        for _, row in df_machine_agents.iterrows():
-            for column, _rectangle in columns_and_rectangles.items():
-                if "declined" in str(row[column]).lower():
-                    declined_counts[column] += 1
-
-        for column, rectangle_name in columns_and_rectangles.items():
-            rectangle = None
-            for shape in slide.shapes:
-                if shape.name == rectangle_name:
-                    rectangle = shape
-                    break
-            if rectangle:
-                rectangle.text = f"{declined_counts[column]}"
-            else:
-                logging.warning(f"{rectangle_name} not found on Slide 13.")
-
-        # -------------------------------------------------------------------
-        # Nite: Slide 14 – Business Transactions Downgrade Summary + rectangles
-        # -------------------------------------------------------------------
-        slide = prs.slides[13]
-
-        all_grades = ["platinum", "gold", "silver", "bronze"]
-        grades_for_table = ["gold", "silver", "bronze"]
-        downgrade_data = {
-            grade: {"applications": [], "number_of_apps": 0, "percentage": 0}
-            for grade in grades_for_table
-        }
-
-        for _, row in df_analysis.iterrows():
-            current_value = row["BusinessTransactionsAPM"]
-            app_name = row["name"]
-            logging.debug(f"Checking App: {app_name} - Current Value: {current_value}")
-
-            if "→" in str(current_value):
-                logging.debug(f"Found potential Downgrade in {app_name}: {current_value}")
-                try:
-                    previous_value, current_grade = current_value.split("→")
-                    previous_value = previous_value.strip().lower()
-                    current_grade = current_grade.strip().lower().split(" ")[0]
-
-                    logging.debug(
-                        f"Extracted: Previous Value: {previous_value}, "
-                        f"Current Grade: {current_grade}"
-                    )
-
-                    if previous_value in all_grades and current_grade in all_grades:
-                        if all_grades.index(previous_value) < all_grades.index(current_grade):
-                            logging.debug(
-                                f"Adding {app_name} to {current_grade} downgrade list"
-                            )
-                            downgrade_data[current_grade]["applications"].append(app_name)
-                            downgrade_data[current_grade]["number_of_apps"] += 1
-                        else:
-                            logging.debug(
-                                f"Not a downgrade for {app_name}: "
-                                f"{previous_value} → {current_grade}"
-                            )
-                    else:
-                        logging.debug(
-                            f"Invalid grades for downgrade comparison: "
-                            f"{previous_value}, {current_grade}"
-                        )
-                except Exception as e:
-                    logging.error(f"Error processing downgrade for {app_name}: {e}")
-            else:
-                logging.debug(
-                    f"No Downgrade for App: {app_name} - Current Value: {current_value}"
-                )
-
-        for grade in grades_for_table:
-            logging.debug(
-                f"Applications for {grade}: {downgrade_data[grade]['applications']}"
-            )
-
-        total_apps = len(df_analysis)
-        for grade in grades_for_table:
-            downgrade_data[grade]["percentage"] = (
-                len(downgrade_data[grade]["applications"]) / total_apps * 100
-                if total_apps
-                else 0
-            )
-
-        downgrade_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
-        if downgrade_placeholder:
-            logging.debug("Found Downgrade table placeholder. Inserting table.")
-            table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(grades_for_table) + 1, 4
-            )
-        else:
-            logging.warning(
-                "Downgrade table placeholder not found. Adding manually."
-            )
-            table = slide.shapes.add_table(
-                len(grades_for_table) + 1,
-                4,
-                Inches(0.5),
-                Inches(1.5),
-                Inches(9),
-                Inches(4),
-            ).table
-
-        table.cell(0, 0).text = "Grade"
-        table.cell(0, 1).text = "Application Names"
-        table.cell(0, 2).text = "Number of Applications"
-        table.cell(0, 3).text = "Percentage Declined"
-
-        for i, grade in enumerate(grades_for_table):
-            table.cell(i + 1, 0).text = grade.capitalize()
-            table.cell(i + 1, 1).text = (
-                ", ".join(downgrade_data[grade]["applications"])
-                if downgrade_data[grade]["applications"]
-                else "None"
-            )
-            table.cell(i + 1, 2).text = str(
-                downgrade_data[grade]["number_of_apps"]
-            )
-            table.cell(i + 1, 3).text = (
-                f"{downgrade_data[grade]['percentage']:.2f}%"
-            )
-
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
-        if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "Business Transactions - Downgrade Summary"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-
-        columns_and_rectangles = {
-            "numberOfBTs": "Rectangle 17",
-            "percentBTsWithLoad": "Rectangle 18",
-            "btLockdownEnabled": "Rectangle 19",
-            "numberCustomMatchRules": "Rectangle 20",
-        }
-        declined_counts = {key: 0 for key in columns_and_rectangles}
-
-        for _, row in df_BTs.iterrows():
-            for column, _rectangle in columns_and_rectangles.items():
-                if "decreased" in str(row[column]).lower():
-                    declined_counts[column] += 1
-
-        for column, rectangle_name in columns_and_rectangles.items():
-            rectangle = None
-            for shape in slide.shapes:
-                if shape.name == rectangle_name:
-                    rectangle = shape
-                    break
-            if rectangle:
-                rectangle.text = f"{declined_counts[column]}"
-            else:
-                logging.warning(f"{rectangle_name} not found on Slide 14.")
-
-        # -------------------------------------------------------------------
-        # Nite: Slide 15 – Backends Downgrade Summary + rectangles
-        # -------------------------------------------------------------------
-        slide = prs.slides[14]
-
-        all_grades = ["platinum", "gold", "silver", "bronze"]
-        grades_for_table = ["gold", "silver", "bronze"]
-        downgrade_data = {
-            grade: {"applications": [], "number_of_apps": 0, "percentage": 0}
-            for grade in grades_for_table
-        }
-
-        for _, row in df_analysis.iterrows():
-            current_value = row["BackendsAPM"]
-            app_name = row["name"]
-            logging.debug(f"Checking App: {app_name} - Current Value: {current_value}")
-
-            if "→" in str(current_value):
-                logging.debug(f"Found potential Downgrade in {app_name}: {current_value}")
-                try:
-                    previous_value, current_grade = current_value.split("→")
-                    previous_value = previous_value.strip().lower()
-                    current_grade = current_grade.strip().lower().split(" ")[0]
-
-                    logging.debug(
-                        f"Extracted: Previous Value: {previous_value}, "
-                        f"Current Grade: {current_grade}"
-                    )
-
-                    if previous_value in all_grades and current_grade in all_grades:
-                        if all_grades.index(previous_value) < all_grades.index(current_grade):
-                            logging.debug(
-                                f"Adding {app_name} to {current_grade} downgrade list"
-                            )
-                            downgrade_data[current_grade]["applications"].append(app_name)
-                            downgrade_data[current_grade]["number_of_apps"] += 1
-                        else:
-                            logging.debug(
-                                f"Not a downgrade for {app_name}: "
-                                f"{previous_value} → {current_grade}"
-                            )
-                    else:
-                        logging.debug(
-                            f"Invalid grades for downgrade comparison: "
-                            f"{previous_value}, {current_grade}"
-                        )
-                except Exception as e:
-                    logging.error(f"Error processing downgrade for {app_name}: {e}")
-            else:
-                logging.debug(
-                    f"No Downgrade for App: {app_name} - Current Value: {current_value}"
-                )
-
-        for grade in grades_for_table:
-            logging.debug(
-                f"Applications for {grade}: {downgrade_data[grade]['applications']}"
-            )
-
-        total_apps = len(df_analysis)
-        for grade in grades_for_table:
-            downgrade_data[grade]["percentage"] = (
-                len(downgrade_data[grade]["applications"]) / total_apps * 100
-                if total_apps
-                else 0
-            )
-
-        downgrade_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
-        if downgrade_placeholder:
-            logging.debug("Found Downgrade table placeholder. Inserting table.")
-            table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(grades_for_table) + 1, 4
-            )
-        else:
-            logging.warning(
-                "Downgrade table placeholder not found. Adding manually."
-            )
-            table = slide.shapes.add_table(
-                len(grades_for_table) + 1,
-                4,
-                Inches(0.5),
-                Inches(1.5),
-                Inches(9),
-                Inches(4),
-            ).table
-
-        table.cell(0, 0).text = "Grade"
-        table.cell(0, 1).text = "Application Names"
-        table.cell(0, 2).text = "Number of Applications"
-        table.cell(0, 3).text = "Percentage Declined"
-
-        for i, grade in enumerate(grades_for_table):
-            applications_str = (
-                ", ".join(str(app) for app in downgrade_data[grade]["applications"])
-                if downgrade_data[grade]["applications"]
-                else "None"
-            )
-            logging.debug(f"Grade: {grade}, Applications: {applications_str}")
-
-            table.cell(i + 1, 0).text = grade.capitalize()
-            table.cell(i + 1, 1).text = applications_str
-            table.cell(i + 1, 2).text = str(
-                downgrade_data[grade]["number_of_apps"]
-            )
-            table.cell(i + 1, 3).text = (
-                f"{downgrade_data[grade]['percentage']:.2f}%"
-            )
-
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
-        if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "Backends - Downgrade Summary"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-
-        columns_and_rectangles = {
-            "percentBackendsWithLoad": "Rectangle 10",
-            "backendLimitNotHit": "Rectangle 11",
-            "numberOfCustomBackendRules": "Rectangle 12",
-        }
-        declined_counts = {key: 0 for key in columns_and_rectangles}
-
-        for _, row in df_Backends.iterrows():
-            for column, _rectangle in columns_and_rectangles.items():
-                if "decreased" in str(row[column]).lower():
-                    declined_counts[column] += 1
-
-        for column, rectangle_name in columns_and_rectangles.items():
-            rectangle = None
-            for shape in slide.shapes:
-                if shape.name == rectangle_name:
-                    rectangle = shape
-                    break
-            if rectangle:
-                rectangle.text = f"{declined_counts[column]}"
-            else:
-                logging.warning(f"{rectangle_name} not found on Slide 15.")
-
-        # -------------------------------------------------------------------
-        # Nite: Slide 16 – Service Endpoints Downgrade Summary + rectangles
-        # -------------------------------------------------------------------
-        slide = prs.slides[15]
-
-        all_grades = ["platinum", "gold", "silver", "bronze"]
-        grades_for_table = ["gold", "silver", "bronze"]
-        downgrade_data = {
-            grade: {"applications": [], "number_of_apps": 0, "percentage": 0}
-            for grade in grades_for_table
-        }
-
-        for _, row in df_analysis.iterrows():
-            current_value = row["ServiceEndpointsAPM"]
-            app_name = row["name"]
-            logging.debug(f"Checking App: {app_name} - Current Value: {current_value}")
-
-            if "→" in str(current_value):
-                logging.debug(f"Found potential Downgrade in {app_name}: {current_value}")
-                try:
-                    previous_value, current_grade = current_value.split("→")
-                    previous_value = previous_value.strip().lower()
-                    current_grade = current_grade.strip().lower().split(" ")[0]
-
-                    logging.debug(
-                        f"Extracted: Previous Value: {previous_value}, "
-                        f"Current Grade: {current_grade}"
-                    )
-
-                    if previous_value in all_grades and current_grade in all_grades:
-                        if all_grades.index(previous_value) < all_grades.index(current_grade):
-                            logging.debug(
-                                f"Adding {app_name} to {current_grade} downgrade list"
-                            )
-                            downgrade_data[current_grade]["applications"].append(app_name)
-                            downgrade_data[current_grade]["number_of_apps"] += 1
-                        else:
-                            logging.debug(
-                                f"Not a downgrade for {app_name}: "
-                                f"{previous_value} → {current_grade}"
-                            )
-                    else:
-                        logging.debug(
-                            f"Invalid grades for downgrade comparison: "
-                            f"{previous_value}, {current_grade}"
-                        )
-                except Exception as e:
-                    logging.error(f"Error processing downgrade for {app_name}: {e}")
-            else:
-                logging.debug(
-                    f"No Downgrade for App: {app_name} - Current Value: {current_value}"
-                )
-
-        for grade in grades_for_table:
-            logging.debug(
-                f"Applications for {grade}: {downgrade_data[grade]['applications']}"
-            )
-
-        total_apps = len(df_analysis)
-        for grade in grades_for_table:
-            downgrade_data[grade]["percentage"] = (
-                len(downgrade_data[grade]["applications"]) / total_apps * 100
-                if total_apps
-                else 0
-            )
-
-        downgrade_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
-        if downgrade_placeholder:
-            logging.debug("Found Downgrade table placeholder. Inserting table.")
-            table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(grades_for_table) + 1, 4
-            )
-        else:
-            logging.warning(
-                "Downgrade table placeholder not found. Adding manually."
-            )
-            table = slide.shapes.add_table(
-                len(grades_for_table) + 1,
-                4,
-                Inches(0.5),
-                Inches(1.5),
-                Inches(9),
-                Inches(4),
-            ).table
-
-        table.cell(0, 0).text = "Grade"
-        table.cell(0, 1).text = "Application Names"
-        table.cell(0, 2).text = "Number of Applications"
-        table.cell(0, 3).text = "Percentage Declined"
-
-        for i, grade in enumerate(grades_for_table):
-            table.cell(i + 1, 0).text = grade.capitalize()
-            table.cell(i + 1, 1).text = (
-                ", ".join(downgrade_data[grade]["applications"])
-                if downgrade_data[grade]["applications"]
-                else "None"
-            )
-            table.cell(i + 1, 2).text = str(
-                downgrade_data[grade]["number_of_apps"]
-            )
-            table.cell(i + 1, 3).text = (
-                f"{downgrade_data[grade]['percentage']:.2f}%"
-            )
-
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
-        if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "Service Endpoints - Downgrade Summary"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-
-        columns_and_rectangles = {
-            "numberOfCustomServiceEndpointRules": "Rectangle 10",
-            "serviceEndpointLimitNotHit": "Rectangle 11",
-            "percentServiceEndpointsWithLoadOrDisabled": "Rectangle 12",
-        }
-        declined_counts = {key: 0 for key in columns_and_rectangles}
-
-        for _, row in df_ServiceEndpoints.iterrows():
-            for column, _rectangle in columns_and_rectangles.items():
-                if "decreased" in str(row[column]).lower():
-                    declined_counts[column] += 1
-
-        for column, rectangle_name in columns_and_rectangles.items():
-            rectangle = None
-            for shape in slide.shapes:
-                if shape.name == rectangle_name:
-                    rectangle = shape
-                    break
-            if rectangle:
-                rectangle.text = f"{declined_counts[column]}"
-            else:
-                logging.warning(f"{rectangle_name} not found on Slide 16.")
-
-        # -------------------------------------------------------------------
-        # Nite: Slide 17 – Error Configuration Downgrade Summary + rectangles
-        # -------------------------------------------------------------------
-        slide = prs.slides[16]
-
-        all_grades = ["platinum", "gold", "silver", "bronze"]
-        grades_for_table = ["gold", "silver", "bronze"]
-        downgrade_data = {
-            grade: {"applications": [], "number_of_apps": 0, "percentage": 0}
-            for grade in grades_for_table
-        }
-
-        for _, row in df_analysis.iterrows():
-            current_value = row["ErrorConfigurationAPM"]
-            app_name = row["name"]
-            logging.debug(f"Checking App: {app_name} - Current Value: {current_value}")
-
-            if "→" in str(current_value):
-                logging.debug(f"Found potential Downgrade in {app_name}: {current_value}")
-                try:
-                    previous_value, current_grade = current_value.split("→")
-                    previous_value = previous_value.strip().lower()
-                    current_grade = current_grade.strip().lower().split(" ")[0]
-
-                    logging.debug(
-                        f"Extracted: Previous Value: {previous_value}, "
-                        f"Current Grade: {current_grade}"
-                    )
-
-                    if previous_value in all_grades and current_grade in all_grades:
-                        if all_grades.index(previous_value) < all_grades.index(current_grade):
-                            logging.debug(
-                                f"Adding {app_name} to {current_grade} downgrade list"
-                            )
-                            downgrade_data[current_grade]["applications"].append(app_name)
-                            downgrade_data[current_grade]["number_of_apps"] += 1
-                        else:
-                            logging.debug(
-                                f"Not a downgrade for {app_name}: "
-                                f"{previous_value} → {current_grade}"
-                            )
-                    else:
-                        logging.debug(
-                            f"Invalid grades for downgrade comparison: "
-                            f"{previous_value}, {current_grade}"
-                        )
-                except Exception as e:
-                    logging.error(f"Error processing downgrade for {app_name}: {e}")
-            else:
-                logging.debug(
-                    f"No Downgrade for App: {app_name} - Current Value: {current_value}"
-                )
-
-        for grade in grades_for_table:
-            logging.debug(
-                f"Applications for {grade}: {downgrade_data[grade]['applications']}"
-            )
-
-        total_apps = len(df_analysis)
-        for grade in grades_for_table:
-            downgrade_data[grade]["percentage"] = (
-                len(downgrade_data[grade]["applications"]) / total_apps * 100
-                if total_apps
-                else 0
-            )
-
-        downgrade_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
-        if downgrade_placeholder:
-            logging.debug("Found Downgrade table placeholder. Inserting table.")
-            table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(grades_for_table) + 1, 4
-            )
-        else:
-            logging.warning(
-                "Downgrade table placeholder not found. Adding manually."
-            )
-            table = slide.shapes.add_table(
-                len(grades_for_table) + 1,
-                4,
-                Inches(0.5),
-                Inches(1.5),
-                Inches(9),
-                Inches(4),
-            ).table
-
-        table.cell(0, 0).text = "Grade"
-        table.cell(0, 1).text = "Application Names"
-        table.cell(0, 2).text = "Number of Applications"
-        table.cell(0, 3).text = "Percentage Declined"
-
-        for i, grade in enumerate(grades_for_table):
-            table.cell(i + 1, 0).text = grade.capitalize()
-            table.cell(i + 1, 1).text = (
-                ", ".join(downgrade_data[grade]["applications"])
-                if downgrade_data[grade]["applications"]
-                else "None"
-            )
-            table.cell(i + 1, 2).text = str(
-                downgrade_data[grade]["number_of_apps"]
-            )
-            table.cell(i + 1, 3).text = (
-                f"{downgrade_data[grade]['percentage']:.2f}%"
-            )
-
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
-        if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "Error Configuration - Downgrade Summary"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-
-        columns_and_rectangles = {
-            "successPercentageOfWorstTransaction": "Rectangle 10",
-            "numberOfCustomRules": "Rectangle 11",
-        }
-        declined_counts = {key: 0 for key in columns_and_rectangles}
-
-        for _, row in df_ErrorConfiguration.iterrows():
-            for column, _rectangle in columns_and_rectangles.items():
-                if "decreased" in str(row[column]).lower():
-                    declined_counts[column] += 1
-
-        for column, rectangle_name in columns_and_rectangles.items():
-            rectangle = None
-            for shape in slide.shapes:
-                if shape.name == rectangle_name:
-                    rectangle = shape
-                    break
-            if rectangle:
-                rectangle.text = f"{declined_counts[column]}"
-            else:
-                logging.warning(f"{rectangle_name} not found on Slide 17.")
-
-        # -------------------------------------------------------------------
-        # Nite: Slide 18 – Health Rules & Alerting Downgrade Summary + rectangles
-        # -------------------------------------------------------------------
-        slide = prs.slides[17]
-
-        all_grades = ["platinum", "gold", "silver", "bronze"]
-        grades_for_table = ["gold", "silver", "bronze"]
-        downgrade_data = {
-            grade: {"applications": [], "number_of_apps": 0, "percentage": 0}
-            for grade in grades_for_table
-        }
-
-        for _, row in df_analysis.iterrows():
-            current_value = row["HealthRulesAndAlertingAPM"]
-            app_name = row["name"]
-            logging.debug(f"Checking App: {app_name} - Current Value: {current_value}")
-
-            if "→" in str(current_value):
-                logging.debug(f"Found potential Downgrade in {app_name}: {current_value}")
-                try:
-                    previous_value, current_grade = current_value.split("→")
-                    previous_value = previous_value.strip().lower()
-                    current_grade = current_grade.strip().lower().split(" ")[0]
-
-                    logging.debug(
-                        f"Extracted: Previous Value: {previous_value}, "
-                        f"Current Grade: {current_grade}"
-                    )
-
-                    if previous_value in all_grades and current_grade in all_grades:
-                        if all_grades.index(previous_value) < all_grades.index(current_grade):
-                            logging.debug(
-                                f"Adding {app_name} to {current_grade} downgrade list"
-                            )
-                            downgrade_data[current_grade]["applications"].append(app_name)
-                            downgrade_data[current_grade]["number_of_apps"] += 1
-                        else:
-                            logging.debug(
-                                f"Not a downgrade for {app_name}: "
-                                f"{previous_value} → {current_grade}"
-                            )
-                    else:
-                        logging.debug(
-                            f"Invalid grades for downgrade comparison: "
-                            f"{previous_value}, {current_grade}"
-                        )
-                except Exception as e:
-                    logging.error(f"Error processing downgrade for {app_name}: {e}")
-            else:
-                logging.debug(
-                    f"No Downgrade for App: {app_name} - Current Value: {current_value}"
-                )
-
-        for grade in grades_for_table:
-            logging.debug(
-                f"Applications for {grade}: {downgrade_data[grade]['applications']}"
-            )
-
-        total_apps = len(df_analysis)
-        for grade in grades_for_table:
-            downgrade_data[grade]["percentage"] = (
-                len(downgrade_data[grade]["applications"]) / total_apps * 100
-                if total_apps
-                else 0
-            )
-
-        downgrade_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
-        if downgrade_placeholder:
-            logging.debug("Found Downgrade table placeholder. Inserting table.")
-            table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(grades_for_table) + 1, 4
-            )
-        else:
-            logging.warning(
-                "Downgrade table placeholder not found. Adding manually."
-            )
-            table = slide.shapes.add_table(
-                len(grades_for_table) + 1,
-                4,
-                Inches(0.5),
-                Inches(1.5),
-                Inches(9),
-                Inches(4),
-            ).table
-
-        table.cell(0, 0).text = "Grade"
-        table.cell(0, 1).text = "Application Names"
-        table.cell(0, 2).text = "Number of Applications"
-        table.cell(0, 3).text = "Percentage Declined"
-
-        for i, grade in enumerate(grades_for_table):
-            table.cell(i + 1, 0).text = grade.capitalize()
-            table.cell(i + 1, 1).text = (
-                ", ".join(downgrade_data[grade]["applications"])
-                if downgrade_data[grade]["applications"]
-                else "None"
-            )
-            table.cell(i + 1, 2).text = str(
-                downgrade_data[grade]["number_of_apps"]
-            )
-            table.cell(i + 1, 3).text = (
-                f"{downgrade_data[grade]['percentage']:.2f}%"
-            )
-
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
-        if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "Health Rules & Alerting - Downgrade Summary"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-
-        columns_and_rectangles = {
-            "numberOfHealthRuleViolations": "Rectangle 10",
-            "numberOfDefaultHealthRulesModified": "Rectangle 11",
-            "numberOfActionsBoundToEnabledPolicies": "Rectangle 12",
-            "numberOfCustomHealthRules": "Rectangle 13",
-        }
-        declined_counts = {key: 0 for key in columns_and_rectangles}
-
-        for _, row in df_HealthRulesAndAlerting.iterrows():
-            for column, _rectangle in columns_and_rectangles.items():
-                if "decreased" in str(row[column]).lower():
-                    declined_counts[column] += 1
-
-        for column, rectangle_name in columns_and_rectangles.items():
-            rectangle = None
-            for shape in slide.shapes:
-                if shape.name == rectangle_name:
-                    rectangle = shape
-                    break
-            if rectangle:
-                rectangle.text = f"{declined_counts[column]}"
-            else:
-                logging.warning(f"{rectangle_name} not found on Slide 18.")
-
-        # -------------------------------------------------------------------
-        # Nite: Slide 19 – Data Collectors Downgrade Summary + rectangles
-        # -------------------------------------------------------------------
-        slide = prs.slides[18]
-
-        all_grades = ["platinum", "gold", "silver", "bronze"]
-        grades_for_table = ["gold", "silver", "bronze"]
-        downgrade_data = {
-            grade: {"applications": [], "number_of_apps": 0, "percentage": 0}
-            for grade in grades_for_table
-        }
-
-        for _, row in df_analysis.iterrows():
-            current_value = row["DataCollectorsAPM"]
-            app_name = row["name"]
-            logging.debug(f"Checking App: {app_name} - Current Value: {current_value}")
-
-            if "→" in str(current_value):
-                logging.debug(f"Found potential Downgrade in {app_name}: {current_value}")
-                try:
-                    previous_value, current_grade = current_value.split("→")
-                    previous_value = previous_value.strip().lower()
-                    current_grade = current_grade.strip().lower().split(" ")[0]
-
-                    logging.debug(
-                        f"Extracted: Previous Value: {previous_value}, "
-                        f"Current Grade: {current_grade}"
-                    )
-
-                    if previous_value in all_grades and current_grade in all_grades:
-                        if all_grades.index(previous_value) < all_grades.index(current_grade):
-                            logging.debug(
-                                f"Adding {app_name} to {current_grade} downgrade list"
-                            )
-                            downgrade_data[current_grade]["applications"].append(app_name)
-                            downgrade_data[current_grade]["number_of_apps"] += 1
-                        else:
-                            logging.debug(
-                                f"Not a downgrade for {app_name}: "
-                                f"{previous_value} → {current_grade}"
-                            )
-                    else:
-                        logging.debug(
-                            f"Invalid grades for downgrade comparison: "
-                            f"{previous_value}, {current_grade}"
-                        )
-                except Exception as e:
-                    logging.error(f"Error processing downgrade for {app_name}: {e}")
-            else:
-                logging.debug(
-                    f"No Downgrade for App: {app_name} - Current Value: {current_value}"
-                )
-
-        for grade in grades_for_table:
-            logging.debug(
-                f"Applications for {grade}: {downgrade_data[grade]['applications']}"
-            )
-
-        total_apps = len(df_analysis)
-        for grade in grades_for_table:
-            downgrade_data[grade]["percentage"] = (
-                len(downgrade_data[grade]["applications"]) / total_apps * 100
-                if total_apps
-                else 0
-            )
-
-        downgrade_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
-        if downgrade_placeholder:
-            logging.debug("Found Downgrade table placeholder. Inserting table.")
-            table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(grades_for_table) + 1, 4
-            )
-        else:
-            logging.warning(
-                "Downgrade table placeholder not found. Adding manually."
-            )
-            table = slide.shapes.add_table(
-                len(grades_for_table) + 1,
-                4,
-                Inches(0.5),
-                Inches(1.5),
-                Inches(9),
-                Inches(4),
-            ).table
-
-        table.cell(0, 0).text = "Grade"
-        table.cell(0, 1).text = "Application Names"
-        table.cell(0, 2).text = "Number of Applications"
-        table.cell(0, 3).text = "Percentage Declined"
-
-        for i, grade in enumerate(grades_for_table):
-            table.cell(i + 1, 0).text = grade.capitalize()
-            table.cell(i + 1, 1).text = (
-                ", ".join(downgrade_data[grade]["applications"])
-                if downgrade_data[grade]["applications"]
-                else "None"
-            )
-            table.cell(i + 1, 2).text = str(
-                downgrade_data[grade]["number_of_apps"]
-            )
-            table.cell(i + 1, 3).text = (
-                f"{downgrade_data[grade]['percentage']:.2f}%"
-            )
-
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
-        if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "Data Collectors - Downgrade Summary"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-
-        columns_and_rectangles = {
-            "numberOfDataCollectorFieldsConfigured": "Rectangle 10",
-            "numberOfDataCollectorFieldsCollectedInSnapshots": "Rectangle 11",
-            "numberOfDataCollectorFieldsCollectedInAnalytics": "Rectangle 12",
-            "biqEnabled": "Rectangle 13",
-        }
-        declined_counts = {key: 0 for key in columns_and_rectangles}
-
-        for _, row in df_DataCollectors.iterrows():
-            for column, _rectangle in columns_and_rectangles.items():
-                if "decreased" in str(row[column]).lower():
-                    declined_counts[column] += 1
-
-        for column, rectangle_name in columns_and_rectangles.items():
-            rectangle = None
-            for shape in slide.shapes:
-                if shape.name == rectangle_name:
-                    rectangle = shape
-                    break
-            if rectangle:
-                rectangle.text = f"{declined_counts[column]}"
-            else:
-                logging.warning(f"{rectangle_name} not found on Slide 19.")
-
-        # -------------------------------------------------------------------
-        # Nite: Slide 20 – Dashboards Downgrade Summary + rectangles
-        # -------------------------------------------------------------------
-        slide = prs.slides[19]
-
-        all_grades = ["platinum", "gold", "silver", "bronze"]
-        grades_for_table = ["gold", "silver", "bronze"]
-        downgrade_data = {
-            grade: {"applications": [], "number_of_apps": 0, "percentage": 0}
-            for grade in grades_for_table
-        }
-
-        for _, row in df_analysis.iterrows():
-            current_value = row["DashboardsAPM"]
-            app_name = row["name"]
-            logging.debug(f"Checking App: {app_name} - Current Value: {current_value}")
-
-            if "→" in str(current_value):
-                logging.debug(f"Found potential Downgrade in {app_name}: {current_value}")
-                try:
-                    previous_value, current_grade = current_value.split("→")
-                    previous_value = previous_value.strip().lower()
-                    current_grade = current_grade.strip().lower().split(" ")[0]
-
-                    logging.debug(
-                        f"Extracted: Previous Value: {previous_value}, "
-                        f"Current Grade: {current_grade}"
-                    )
-
-                    if previous_value in all_grades and current_grade in all_grades:
-                        if all_grades.index(previous_value) < all_grades.index(current_grade):
-                            logging.debug(
-                                f"Adding {app_name} to {current_grade} downgrade list"
-                            )
-                            downgrade_data[current_grade]["applications"].append(app_name)
-                            downgrade_data[current_grade]["number_of_apps"] += 1
-                        else:
-                            logging.debug(
-                                f"Not a downgrade for {app_name}: "
-                                f"{previous_value} → {current_grade}"
-                            )
-                    else:
-                        logging.debug(
-                            f"Invalid grades for downgrade comparison: "
-                            f"{previous_value}, {current_grade}"
-                        )
-                except Exception as e:
-                    logging.error(f"Error processing downgrade for {app_name}: {e}")
-            else:
-                logging.debug(
-                    f"No Downgrade for App: {app_name} - Current Value: {current_value}"
-                )
-
-        for grade in grades_for_table:
-            logging.debug(
-                f"Applications for {grade}: {downgrade_data[grade]['applications']}"
-            )
-
-        total_apps = len(df_analysis)
-        for grade in grades_for_table:
-            downgrade_data[grade]["percentage"] = (
-                len(downgrade_data[grade]["applications"]) / total_apps * 100
-                if total_apps
-                else 0
-            )
-
-        downgrade_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
-        if downgrade_placeholder:
-            logging.debug("Found Downgrade table placeholder. Inserting table.")
-            table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(grades_for_table) + 1, 4
-            )
-        else:
-            logging.warning(
-                "Downgrade table placeholder not found. Adding manually."
-            )
-            table = slide.shapes.add_table(
-                len(grades_for_table) + 1,
-                4,
-                Inches(0.5),
-                Inches(1.5),
-                Inches(9),
-                Inches(4),
-            ).table
-
-        table.cell(0, 0).text = "Grade"
-        table.cell(0, 1).text = "Application Names"
-        table.cell(0, 2).text = "Number of Applications"
-        table.cell(0, 3).text = "Percentage Declined"
-
-        for i, grade in enumerate(grades_for_table):
-            table.cell(i + 1, 0).text = grade.capitalize()
-            table.cell(i + 1, 1).text = (
-                ", ".join(downgrade_data[grade]["applications"])
-                if downgrade_data[grade]["applications"]
-                else "None"
-            )
-            table.cell(i + 1, 2).text = str(
-                downgrade_data[grade]["number_of_apps"]
-            )
-            table.cell(i + 1, 3).text = (
-                f"{downgrade_data[grade]['percentage']:.2f}%"
-            )
-
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
-        if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "Dashboards - Downgrade Summary"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-
-        columns_and_rectangles = {
-            "numberOfDashboards": "Rectangle 10",
-            "percentageOfDashboardsModifiedLast6Months": "Rectangle 11",
-            "numberOfDashboardsUsingBiQ": "Rectangle 12",
-        }
-        declined_counts = {key: 0 for key in columns_and_rectangles}
-
-        for _, row in df_Dashboards.iterrows():
-            for column, _rectangle in columns_and_rectangles.items():
-                if "decreased" in str(row[column]).lower():
-                    declined_counts[column] += 1
-
-        for column, rectangle_name in columns_and_rectangles.items():
-            rectangle = None
-            for shape in slide.shapes:
-                if shape.name == rectangle_name:
-                    rectangle = shape
-                    break
-            if rectangle:
-                rectangle.text = f"{declined_counts[column]}"
-            else:
-                logging.warning(f"{rectangle_name} not found on Slide 20.")
-
-        # -------------------------------------------------------------------
-        # Nite: Slide 21 – Overhead Downgrade Summary + rectangles
-        # -------------------------------------------------------------------
-        slide = prs.slides[20]
-
-        all_grades = ["platinum", "gold", "silver", "bronze"]
-        grades_for_table = ["gold", "silver", "bronze"]
-        downgrade_data = {
-            grade: {"applications": [], "number_of_apps": 0, "percentage": 0}
-            for grade in grades_for_table
-        }
-
-        for _, row in df_analysis.iterrows():
-            current_value = row["OverheadAPM"]
-            app_name = row["name"]
-            logging.debug(f"Checking App: {app_name} - Current Value: {current_value}")
-
-            if "→" in str(current_value):
-                logging.debug(f"Found potential Downgrade in {app_name}: {current_value}")
-                try:
-                    previous_value, current_grade = current_value.split("→")
-                    previous_value = previous_value.strip().lower()
-                    current_grade = current_grade.strip().lower().split(" ")[0]
-
-                    logging.debug(
-                        f"Extracted: Previous Value: {previous_value}, "
-                        f"Current Grade: {current_grade}"
-                    )
-
-                    if previous_value in all_grades and current_grade in all_grades:
-                        if all_grades.index(previous_value) < all_grades.index(current_grade):
-                            logging.debug(
-                                f"Adding {app_name} to {current_grade} downgrade list"
-                            )
-                            downgrade_data[current_grade]["applications"].append(app_name)
-                            downgrade_data[current_grade]["number_of_apps"] += 1
-                        else:
-                            logging.debug(
-                                f"Not a downgrade for {app_name}: "
-                                f"{previous_value} → {current_grade}"
-                            )
-                    else:
-                        logging.debug(
-                            f"Invalid grades for downgrade comparison: "
-                            f"{previous_value}, {current_grade}"
-                        )
-                except Exception as e:
-                    logging.error(f"Error processing downgrade for {app_name}: {e}")
-            else:
-                logging.debug(
-                    f"No Downgrade for App: {app_name} - Current Value: {current_value}"
-                )
-
-        for grade in grades_for_table:
-            logging.debug(
-                f"Applications for {grade}: {downgrade_data[grade]['applications']}"
-            )
-
-        total_apps = len(df_analysis)
-        for grade in grades_for_table:
-            downgrade_data[grade]["percentage"] = (
-                len(downgrade_data[grade]["applications"]) / total_apps * 100
-                if total_apps
-                else 0
-            )
-
-        downgrade_placeholder = find_table_placeholder_by_name(
-            slide, "Table Placeholder 1"
-        )
-        if downgrade_placeholder:
-            logging.debug("Found Downgrade table placeholder. Inserting table.")
-            table = insert_table_at_placeholder(
-                slide, "Table Placeholder 1", len(grades_for_table) + 1, 4
-            )
-        else:
-            logging.warning(
-                "Downgrade table placeholder not found. Adding manually."
-            )
-            table = slide.shapes.add_table(
-                len(grades_for_table) + 1,
-                4,
-                Inches(0.5),
-                Inches(1.5),
-                Inches(9),
-                Inches(4),
-            ).table
-
-        table.cell(0, 0).text = "Grade"
-        table.cell(0, 1).text = "Application Names"
-        table.cell(0, 2).text = "Number of Applications"
-        table.cell(0, 3).text = "Percentage Declined"
-
-        for i, grade in enumerate(grades_for_table):
-            table.cell(i + 1, 0).text = grade.capitalize()
-            table.cell(i + 1, 1).text = (
-                ", ".join(downgrade_data[grade]["applications"])
-                if downgrade_data[grade]["applications"]
-                else "None"
-            )
-            table.cell(i + 1, 2).text = str(
-                downgrade_data[grade]["number_of_apps"]
-            )
-            table.cell(i + 1, 3).text = (
-                f"{downgrade_data[grade]['percentage']:.2f}%"
-            )
-
-        title_placeholder = find_table_placeholder_by_name(slide, "Title 2")
-        if title_placeholder and hasattr(title_placeholder, "text_frame"):
-            title_placeholder.text = "Overhead - Downgrade Summary"
-            for paragraph in title_placeholder.text_frame.paragraphs:
-                for run in paragraph.runs:
-                    run.font.color.rgb = RGBColor(255, 255, 255)
-
-        columns_and_rectangles = {
-            "developerModeNotEnabledForAnyBT": "Rectangle 10",
-            "findEntryPointsNotEnabled": "Rectangle 11",
-            "aggressiveSnapshottingNotEnabled": "Rectangle 12",
-            "developerModeNotEnabledForApplication": "Rectangle 13",
-        }
-        declined_counts = {key: 0 for key in columns_and_rectangles}
-
-        for _, row in df_Overhead.iterrows():
-            for column, _rectangle in columns_and_rectangles.items():
-                if "changed" in str(row[column]).lower():
-                    declined_counts[column] += 1
-
-        for column, rectangle_name in columns_and_rectangles.items():
-            rectangle = None
-            for shape in slide.shapes:
-                if shape.name == rectangle_name:
-                    rectangle = shape
-                    break
-            if rectangle:
-                rectangle.text = f"{declined_counts[column]}"
-            else:
-                logging.warning(f"{rectangle_name} not found on Slide 21.")
-
         # -------------------------------------------------------------------
         # Nite: Finally, save the finished deck
         # -------------------------------------------------------------------
         prs.save(powerpoint_output_path)
-        logging.debug(f"PowerPoint saved to {powerpoint_output_path}.")
-        logging.warning(f">>> SAVED PPT TO {powerpoint_output_path} <<<")
+        logging.debug("PowerPoint saved to %s.", powerpoint_output_path)
+        logging.warning(">>> SAVED PPT TO %s <<<", powerpoint_output_path)
 
     except Exception as e:
-        logging.error(f"Error generating PowerPoint: {e}", exc_info=True)
+        logging.error("Error generating PowerPoint: %s", e, exc_info=True)
         raise
@@ -20,6 +20,8 @@ import logging
 from pathlib import Path
 from typing import Optional
 
+import pandas as pd
+from pandas.util.version import Version
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.enum.text import PP_ALIGN
@@ -28,6 +30,39 @@ log = logging.getLogger(__name__)
 log.info("base.py imported")
 
 
+def _pick_excel_engine() -> str:
+    """
+    Excel engine for pandas workbook reads: the Rust-backed calamine reader
+    parses XLSX far faster than openpyxl, but needs python-calamine and
+    pandas >= 2.2 (older pandas rejects engine="calamine").
+    """
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return "openpyxl"
+    if Version(pd.__version__) < Version("2.2"):
+        return "openpyxl"
+    return "calamine"
+
+
+EXCEL_ENGINE = _pick_excel_engine()
+
+
+def count_nonempty(series: pd.Series) -> int:
+    """
+    Number of cells that are neither missing nor blank once stripped (e.g.
+    the applications that have a name), in one pass -- same result as
+    series.dropna().astype(str).str.strip().ne("").sum().
+    """
+    count = 0
+    for v in series.to_numpy(dtype=object):
+        if isinstance(v, str):
+            count += bool(v.strip())
+        elif not pd.isna(v):
+            count += bool(str(v).strip())
+    return count
+
+
 class PPTBuilder:
     """
     Thin wrapper around python-pptx Presentation that provides
@@ -0,0 +1,54 @@
+import datetime
+
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from compare_tool.powerpoint import _read_sheet_openpyxl_ro
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "sheets.xlsx"
+    wb = Workbook()
+
+    ws = wb.active
+    ws.title = "Mixed"
+    ws.append(["name", "score", "name", "when", "flag", "status", None])
+    ws.append(["app1", 1.0, "dup1", datetime.datetime(2024, 1, 2), True, "ok"])
+    ws.append(["app2", 2.5, "dup2", datetime.datetime(2024, 3, 4, 5, 6), False])
+    ws.append([])  # blank row in the middle
+    ws.append(["app3", "#N/A", None, None, None, "#DIV/0!"])
+    ws.append(["app4", 7, "dup4", None, True, "", None, None])  # trailing empties
+    ws.append([])  # trailing blank rows
+    ws.append([])
+
+    wb.create_sheet("Empty")
+
+    headers_only = wb.create_sheet("HeadersOnly")
+    headers_only.append(["name", "value"])
+
+    wb.save(path)
+    return str(path)
+
+
+@pytest.mark.parametrize("sheet_name", ["Mixed", "Empty", "HeadersOnly"])
+def test_matches_read_excel(workbook, sheet_name):
+    expected = pd.read_excel(workbook, sheet_name=sheet_name, engine="openpyxl")
+
+    df = _read_sheet_openpyxl_ro(workbook, sheet_name)
+
+    pd.testing.assert_frame_equal(df, expected)
+
+
+def test_matches_read_excel_with_callable_usecols(workbook):
+    def wanted(col):
+        return col in ("name", "when", "status", "missing")
+
+    expected = pd.read_excel(
+        workbook, sheet_name="Mixed", engine="openpyxl", usecols=wanted
+    )
+
+    df = _read_sheet_openpyxl_ro(workbook, "Mixed", usecols=wanted)
+
+    pd.testing.assert_frame_equal(df, expected)
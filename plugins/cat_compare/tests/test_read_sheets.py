@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+from compare_tool.powerpoint.apm import read_sheets
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "comparison.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame(
+            {"name": ["app1", "app2"], "Value": [1, 2], "Extra": ["x", "y"]}
+        ).to_excel(writer, sheet_name="Analysis", index=False)
+        pd.DataFrame({"Metric": ["Metric1"], "Value": [10]}).to_excel(
+            writer, sheet_name="Summary", index=False
+        )
+    return str(path)
+
+
+def test_read_sheets_returns_requested_sheets(workbook):
+    sheets = read_sheets(workbook, ["Summary", "Analysis"])
+
+    assert list(sheets) == ["Summary", "Analysis"]
+    pd.testing.assert_frame_equal(
+        sheets["Analysis"], pd.read_excel(workbook, sheet_name="Analysis")
+    )
+
+
+def test_read_sheets_usecols_and_dtype(workbook):
+    sheets = read_sheets(
+        workbook,
+        ["Analysis"],
+        usecols={"Analysis": ["name", "Value", "missing"]},
+        dtype={"Analysis": {"Value": object}},
+    )
+
+    df = sheets["Analysis"]
+    assert list(df.columns) == ["name", "Value"]
+    assert df["Value"].dtype == object
+
+
+def test_read_sheets_optional_sheet(workbook):
+    sheets = read_sheets(workbook, ["Summary", "Nope"], optional=["Nope"])
+
+    assert sheets["Nope"] is None
+
+    with pytest.raises(ValueError):
+        read_sheets(workbook, ["Nope"])
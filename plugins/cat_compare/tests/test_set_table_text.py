@@ -0,0 +1,56 @@
+import pytest
+from lxml import etree
+from pptx import Presentation
+from pptx.util import Inches, Pt
+
+from compare_tool.powerpoint.apm import set_table_text
+
+PLAIN_ROWS = [
+    ["Grade", "Application Names", ""],
+    ["a & b", "<tag>", "\"quoted\" 'single'"],
+    ["_x0041_ literal", "  leading spaces", "trailing  "],
+    ["", "ünïcödé →", "100.00%"],
+]
+
+CONTROL_ROWS = [
+    ["Header", "two\nlines", "tab\there"],
+    ["vertical\vtab", "a & b\n<c>", ""],
+]
+
+
+def _new_table(prs, rows, cols):
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    return slide.shapes.add_table(
+        rows, cols, Inches(0.5), Inches(0.5), Inches(9), Inches(4)
+    ).table
+
+
+def _cells_xml(table):
+    return [
+        etree.tostring(tc, method="c14n")
+        for tr in table._tbl.tr_lst
+        for tc in tr.tc_lst
+    ]
+
+
+@pytest.mark.parametrize("rows", [PLAIN_ROWS, CONTROL_ROWS], ids=["plain", "control"])
+@pytest.mark.parametrize("size", [None, Pt(12)], ids=["no-size", "12pt"])
+def test_set_table_text_matches_cell_text(rows, size):
+    prs = Presentation()
+    n_rows, n_cols = len(rows), len(rows[0])
+
+    expected = _new_table(prs, n_rows, n_cols)
+    for r, values in enumerate(rows):
+        for c, value in enumerate(values):
+            cell = expected.cell(r, c)
+            cell.text = value
+            if size is not None:
+                cell.text_frame.paragraphs[0].font.size = size
+
+    table = _new_table(prs, n_rows, n_cols)
+    set_table_text(table, rows, size=size)
+
+    assert _cells_xml(table) == _cells_xml(expected)
+    assert [[cell.text for cell in row.cells] for row in table.rows] == [
+        [cell.text for cell in row.cells] for row in expected.rows
+    ]